@@ -0,0 +1 @@
+"""Setup file parsing and setup sheet generation used by the SimFlowSetupAgent"""
@@ -2,105 +2,100 @@
 """
 Setup Sheet Generator Script
 Generate setup parameter tables and blank setup sheets for vehicles
+
+Run from the SimFlowSetupAgent directory as a module:
+    python -m scripts.generate_setup_sheets list
 """
 
 import sys
 import argparse
 from pathlib import Path
+from typing import Iterable
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+# Profiles shipped next to this script, so the default does not depend on the working directory
+DEFAULT_PROFILES_DIR = Path(__file__).resolve().parent.parent / "vehicle_profiles"
 
-from src.vehicle_profile_manager import VehicleProfileManager
-from src.setup_sheet_generator import SetupSheetGenerator
+def _emit(chunks: Iterable[str], output: str = None, label: str = "Output"):
+    """Stream text chunks to the output file if one was given, otherwise to stdout"""
+    if output:
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(chunks)
+        print(f"{label} saved to: {output_path}")
+    else:
+        sys.stdout.writelines(chunks)
+        sys.stdout.write("\n")
 
-def main():
-    parser = argparse.ArgumentParser(description="Generate vehicle setup sheets and parameter tables")
-    parser.add_argument("action", choices=["list", "parameters", "sheet", "summary"], 
-                       help="Action to perform")
-    parser.add_argument("--vehicle", "-v", help="Vehicle profile key (e.g., nascar_nextgen_speedway)")
-    parser.add_argument("--format", "-f", choices=["markdown", "html", "csv"], default="markdown",
-                       help="Output format")
-    parser.add_argument("--output", "-o", help="Output file path")
+def _do_list(args, profile_manager):
+    """List all available vehicle profiles"""
+    print("Available Vehicle Profiles:")
+    print("=" * 50)
     
-    args = parser.parse_args()
+    for category, vehicles in profile_manager.list_names().items():
+        print(f"\n{category.upper()}:")
+        for vehicle_key, vehicle_name in vehicles:
+            print(f"  \u2022 {vehicle_key} - {vehicle_name}")
+
+def _do_parameters(args, profile_manager):
+    """Generate parameter table"""
+    from src.setup_sheet_generator import SetupSheetGenerator
+    sheet_generator = SetupSheetGenerator(profile_manager)
+    
+    print(f"Generating parameter table for: {args.vehicle}")
+    print("=" * 60)
     
-    # Initialize managers
-    vehicles_dir = project_root / "vehicle_profiles"
-    profile_manager = VehicleProfileManager(vehicles_dir)
+    _emit(sheet_generator.iter_parameter_table(args.vehicle, args.format), args.output, "Parameter table")
+
+def _do_sheet(args, profile_manager):
+    """Generate blank setup sheet"""
+    from src.setup_sheet_generator import SetupSheetGenerator
     sheet_generator = SetupSheetGenerator(profile_manager)
     
-    if args.action == "list":
-        # List all available vehicle profiles
-        print("Available Vehicle Profiles:")
-        print("=" * 50)
-        
-        categories = profile_manager.get_vehicle_categories()
-        for category, vehicles in categories.items():
-            print(f"\n{category.upper()}:")
-            for vehicle_key in vehicles:
-                profile = profile_manager.get_profile(vehicle_key)
-                vehicle_info = profile.get("vehicle_info", {})
-                print(f"  • {vehicle_key} - {vehicle_info.get('name', 'Unknown')}")
+    print(f"Generating blank setup sheet for: {args.vehicle}")
+    print("=" * 60)
     
-    elif args.action == "parameters":
-        # Generate parameter table
-        if not args.vehicle:
-            print("Error: --vehicle required for parameters action")
-            print("Use 'list' action to see available vehicles")
-            sys.exit(1)
-        
-        print(f"Generating parameter table for: {args.vehicle}")
-        print("=" * 60)
-        
-        table = sheet_generator.generate_parameter_table(args.vehicle, args.format)
-        
-        if args.output:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(table)
-            print(f"Parameter table saved to: {output_path}")
-        else:
-            print(table)
+    _emit(sheet_generator.iter_blank_setup_sheet(args.vehicle, args.format), args.output, "Setup sheet")
+
+def _do_summary(args, profile_manager):
+    """Generate summary of all profiles"""
+    print("Vehicle Profile Summary")
+    print("=" * 60)
+    
+    summary = profile_manager.export_profile_summary()
+    _emit([summary], args.output, "Summary")
+
+def main():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--output", "-o", help="Output file path")
+    common.add_argument("--profiles-dir", default=str(DEFAULT_PROFILES_DIR),
+                       help="Vehicle profiles directory (default: SimFlowSetupAgent/vehicle_profiles)")
+    
+    vehicle_options = argparse.ArgumentParser(add_help=False)
+    vehicle_options.add_argument("--vehicle", "-v", required=True,
+                                help="Vehicle profile key (e.g., nascar_nextgen_speedway); "
+                                     "use the 'list' action to see available vehicles")
+    vehicle_options.add_argument("--format", "-f", choices=["markdown", "html", "csv"], default="markdown",
+                                help="Output format")
+    
+    parser = argparse.ArgumentParser(description="Generate vehicle setup sheets and parameter tables")
+    actions = parser.add_subparsers(dest="action", required=True, help="Action to perform")
+    actions.add_parser("list", parents=[common],
+                       help="List available vehicle profiles").set_defaults(func=_do_list)
+    actions.add_parser("parameters", parents=[common, vehicle_options],
+                       help="Generate a parameter table").set_defaults(func=_do_parameters)
+    actions.add_parser("sheet", parents=[common, vehicle_options],
+                       help="Generate a blank setup sheet").set_defaults(func=_do_sheet)
+    actions.add_parser("summary", parents=[common],
+                       help="Summarize all vehicle profiles").set_defaults(func=_do_summary)
+    
+    args = parser.parse_args()
     
-    elif args.action == "sheet":
-        # Generate blank setup sheet
-        if not args.vehicle:
-            print("Error: --vehicle required for sheet action")
-            print("Use 'list' action to see available vehicles")
-            sys.exit(1)
-        
-        print(f"Generating blank setup sheet for: {args.vehicle}")
-        print("=" * 60)
-        
-        sheet = sheet_generator.generate_blank_setup_sheet(args.vehicle, args.format)
-        
-        if args.output:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(sheet)
-            print(f"Setup sheet saved to: {output_path}")
-        else:
-            print(sheet)
+    # Import only what the chosen action needs so --help and list stay fast
+    from src.vehicle_profile_manager import VehicleProfileManager
     
-    elif args.action == "summary":
-        # Generate summary of all profiles
-        print("Vehicle Profile Summary")
-        print("=" * 60)
-        
-        summary = profile_manager.export_profile_summary()
-        
-        if args.output:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(summary)
-            print(f"Summary saved to: {output_path}")
-        else:
-            print(summary)
+    profile_manager = VehicleProfileManager(Path(args.profiles_dir))
+    args.func(args, profile_manager)
 
 if __name__ == "__main__":
     main()
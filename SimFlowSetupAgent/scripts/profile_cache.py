@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+SimFlowSetupAgent - Vehicle Profile Cache
+Loads vehicle profile JSON files through a pickle cache, shared by the setup file parser and the setup sheet generator
+"""
+
+import os
+import json
+import pickle
+from typing import Dict, Any, List, Optional
+from pathlib import Path
+import logging
+
+try:
+    import orjson
+except ImportError:  # optional: faster profile parsing when available
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Loaded vehicle profiles are cached here, keyed by profile file names and mtimes
+PROFILE_CACHE_NAME = ".cache.pkl"
+
+
+def load_json_file(path: Path) -> Any:
+    """Load a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def list_profile_files(directory: Path) -> List[Path]:
+    """Return the *.json files in a directory, sorted by name; empty if it does not exist"""
+    # Filtering scandir names and sorting plain strings is about twice as fast as glob + sorting Paths
+    try:
+        with os.scandir(directory) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith(".json"))
+    except FileNotFoundError:
+        return []
+    return [directory / name for name in names]
+
+
+def load_profile_directory(directory: Path, profiles: Dict[str, Any]):
+    """Load every profile in directory into profiles by category, reusing the pickle cache when unchanged"""
+    profile_files = list_profile_files(directory)
+    signature = tuple((p.name, p.stat().st_mtime_ns) for p in profile_files)
+    cache_file = directory / PROFILE_CACHE_NAME
+    
+    cached = read_profile_cache(cache_file, signature)
+    if cached is not None:
+        profiles.update(cached)
+        logger.info(f"Loaded {len(profile_files)} vehicle profiles from cache")
+        return
+    
+    for profile_file in profile_files:
+        profile_data = load_json_file(profile_file)
+        category = profile_data.get("vehicle_info", {}).get("category", "unknown")
+        profiles[category] = profile_data
+        logger.info(f"Loaded vehicle profile: {profile_file.name}")
+    
+    if profile_files:
+        write_profile_cache(cache_file, signature, profiles)
+
+
+def read_profile_cache(cache_file: Path, signature: tuple) -> Optional[Dict[str, Any]]:
+    """Return cached profiles if the cache matches the current file signature"""
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_signature, profiles = pickle.load(f)
+    except Exception:
+        return None
+    return profiles if cached_signature == signature else None
+
+
+def write_profile_cache(cache_file: Path, signature: tuple, profiles: Dict[str, Any]):
+    """Persist loaded profiles keyed by the (name, mtime) signature"""
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump((signature, profiles), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Could not write vehicle profile cache: {e}")
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+SimFlowSetupAgent - Report Common
+Report labels and parsed setup keys shared by the agent, the setup file parser and the setup sheet generator
+"""
+
+from functools import lru_cache
+
+# Distinct parameter/section names whose report labels are cached
+REPORT_LABEL_CACHE_SIZE = 512
+
+# Parsed tire keys in LF, RF, LR, RR order for the balance analysis
+START_PRESSURE_KEYS = tuple(f"{pos}_start_pressure" for pos in ('left_front', 'right_front', 'left_rear', 'right_rear'))
+
+
+@lru_cache(maxsize=REPORT_LABEL_CACHE_SIZE)
+def pretty_label(key: str) -> str:
+    """Report label for a parameter key, e.g. left_front_camber -> Left Front Camber"""
+    return key.replace('_', ' ').title()
+
+
+@lru_cache(maxsize=REPORT_LABEL_CACHE_SIZE)
+def section_title(section_name: str) -> str:
+    """Report heading for a section key, e.g. driver_aids -> DRIVER AIDS"""
+    return section_name.upper().replace('_', ' ')
@@ -6,17 +6,447 @@ Parses iRacing .htm setup files and MoTeC setup sheets (.csv/.xlsm).
 
 import os
 import re
+import asyncio
+import gzip
+import sys
 import json
-import pandas as pd
-from typing import Dict, Any, List, Optional, Union
+import shutil
+import threading
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, Union
 from pathlib import Path
 import logging
-from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON serialization when available
+    orjson = None
+
+try:
+    from watchfiles import Change, watch as watch_paths
+except ImportError:  # optional: event-driven DROP-OFF watching when available
+    watch_paths = None
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # optional: Linux inotify watching when watchfiles is missing
+    INotify = None
+
+try:
+    import zstandard
+except ImportError:  # optional: zstd-compressed batch archives, gzip otherwise
+    zstandard = None
+
+if __package__:
+    from .profile_cache import load_profile_directory
+    from .report_common import pretty_label, section_title
+else:
+    from profile_cache import load_profile_directory
+    from report_common import pretty_label, section_title
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Chunk sizes when streaming MoTeC CSV values (pandas rows, pyarrow bytes)
+MOTEC_CSV_CHUNK_ROWS = 10000
+MOTEC_CSV_BLOCK_BYTES = 1 << 20
+
+# Files handed to each pool worker at a time by parse_directory
+PARSE_CHUNK_FILES = 8
+
+# Leading characters of a setup file scanned for car/track detection
+DETECTION_HEAD_CHARS = 4096
+DETECTION_CACHE_SIZE = 512
+
+# Bytes requested per in-kernel copy call, and the buffer used when neither
+# copy_file_range nor sendfile is available for a pair of files
+KERNEL_COPY_BYTES = 1 << 30
+COPY_BUFFER_BYTES = 1 << 20
+
+# DROP-OFF subfolders monitored by watch_drop_off_folder
+WATCH_FOLDERS = ("setup_files", "motec_sheets", "images")
+
+# Guards SetupFileParser._created_dirs when drop-off files are organized from
+# worker threads; module level so parsers stay picklable for parse_directory
+_CREATED_DIRS_LOCK = threading.Lock()
+
+# Setup file patterns, compiled once at import rather than on every parse
+TIRE_POSITIONS = ('LEFT FRONT', 'RIGHT FRONT', 'LEFT REAR', 'RIGHT REAR')
+
+# Section headings such as <H2><U>LEFT FRONT:</U></H2>; heading-anchored
+# patterns below are matched directly at the end of an indexed heading, and
+# per-corner field matches are attributed to the heading that precedes them
+_SECTION_HEADING_RE = re.compile(r'<H2><U>([^<:]+):</U></H2>')
+
+# Literal text that every pattern of a section needs; a section with none of
+# its anchors in the file is skipped by parse_iracing_htm
+SECTION_ANCHORS = {
+    "tires": ("Starting pressure", "Last temps", "Tire type"),
+    "aerodynamics": ("Wing ", "plitter", "RH at speed", "downforce", "spoiler"),
+    "suspension": ("Corner weight", "Ride height", "Spring rate", "Camber", "Spring perch offset",
+                   "stiffness", "Bump rubber gap", "oe-in", "ARB setting", "Anti-roll bar",
+                   "Nose weight", "Cross weight"),
+    "brakes": ("Brake pressure bias", "master cyl", "Brake pads", "Rear brake valve", "Handbrake ratio"),
+    "differential": ("Friction Faces", "Diff preload"),
+    "dampers": ("damping",),
+    "driver_aids": ("ABS setting", "TC setting", "Throttle shape setting", "Launch RPM limit"),
+    "gears": ("Gear stack",),
+    "fuel_weight": ("Fuel level", "WtDist", "Cross weight"),
+}
+
+# Title and track
+_TITLE_RE = re.compile(r'(\w+) setup: (.+?)<br>\s*track: (.+?)</H2>')
+_TRACK_NAME_RE = re.compile(r'track: ([^<]+)', re.IGNORECASE)
+
+# Tires
+_START_PRESSURE_RE = re.compile(r'\s*Starting pressure: <U>([0-9.]+) psi</U>')
+_HOT_PRESSURE_RE = re.compile(r'Starting pressure: <U>[0-9.]+ psi</U><br>Last hot pressure: <U>([0-9.]+) psi</U>')
+_TIRE_TEMPS_RE = re.compile(r'Last temps [OMI ]+: <U>([0-9]+)F</U><br><U>([0-9]+)F</U><br><U>([0-9]+)F</U>')
+_TIRE_TYPE_RE = re.compile(r'Tire type: <U>([^<]+)</U>')
+
+# Aerodynamics
+# Optional label prefixes ("Rear ", "Center front ") are left out: they never
+# change the captured value, and a leading optional group disables re's fast
+# literal-prefix scan, making these two the slowest searches in the parser
+_WING_ANGLE_RE = re.compile(r'Wing (?:setting|angle): <U>([0-9.-]+) degrees</U>')
+_SPLITTER_HEIGHT_RE = re.compile(r'[Ss]plitter height:? <U>([0-9.]+) in</U>')
+_FRONT_RH_AT_SPEED_RE = re.compile(r'Front RH at speed: <U>([0-9.]+)"</U>')
+_REAR_RH_AT_SPEED_RE = re.compile(r'Rear RH at speed: <U>([0-9.]+)"</U>')
+_FRONT_DOWNFORCE_RE = re.compile(r'Front downforce: <U>([0-9.]+)%</U>')
+_REAR_SPOILER_RE = re.compile(r'Rear spoiler: <U>([0-9.]+) (?:degrees|in)</U>')
+_FRONT_SPLITTER_RE = re.compile(r'Front splitter: <U>([0-9.]+) (?:degrees|in)</U>')
+_TCR_WING_SETTING_RE = re.compile(r'Rear Wing setting: <U>([+-]?[0-9.]+) degrees</U>')
+
+# Suspension
+_CORNER_WEIGHT_RE = re.compile(r'\s*Corner weight: <U>([0-9]+) lbs</U>')
+_RIDE_HEIGHT_RE = re.compile(r'Ride height: <U>([0-9.]+) in</U>')
+_SPRING_RATE_RE = re.compile(r'Spring rate: <U>([0-9]+) lbs/in</U>')
+_CAMBER_RE = re.compile(r'Camber: <U>([+-][0-9.]+) deg</U>')
+_SPRING_PERCH_OFFSET_RE = re.compile(r'Spring perch offset: <U>([0-9.]+)"</U>')
+_BUMP_STIFFNESS_RE = re.compile(r'Bump stiffness: <U>([+-][0-9]+) clicks</U>')
+_REBOUND_STIFFNESS_RE = re.compile(r'Rebound stiffness: <U>([+-][0-9]+) clicks</U>')
+_BUMP_RUBBER_GAP_RE = re.compile(r'Bump rubber gap: <U>([0-9.]+) in</U>')
+_TOE_IN_RE = re.compile(r'Toe-in: <U>([+-][0-9.]+) in</U>')
+_TOE_FRACTION_RE = re.compile(r'Toe-in: <U>([+-]?[0-9]+)/32"</U>')
+_TOTAL_TOE_IN_RE = re.compile(r'Total toe-in: <U>([+-][0-9.]+) in</U>')
+_FRONT_ARB_SETTING_RE = re.compile(r'ARB setting: <U>([0-9]+)</U>')
+_REAR_ARB_SETTING_RE = re.compile(r'RARB setting: <U>([0-9]+)</U>')
+_ARB_WALL_THICKNESS_RE = re.compile(r'Anti-roll bar wall thickness: <U>([0-9.]+)"</U>')
+_ARB_BLADE_LENGTH_RE = re.compile(r'Anti-roll bar blade length: <U>([0-9.]+)"</U>')
+_NOSE_WEIGHT_RE = re.compile(r'Nose weight: <U>([0-9.]+)%</U>')
+_CROSS_WEIGHT_RE = re.compile(r'Cross weight: <U>([0-9.]+)%</U>')
+
+# Per-corner suspension fields as (key suffix, pattern, converter)
+_CORNER_FIELDS = (
+    ("ride_height", _RIDE_HEIGHT_RE, float),
+    ("spring_rate", _SPRING_RATE_RE, int),
+    ("camber", _CAMBER_RE, float),
+)
+# TCR cars often have spring perch offset, and their damper settings are bump/rebound stiffness
+_TOURING_CORNER_FIELDS = (
+    ("spring_perch_offset", _SPRING_PERCH_OFFSET_RE, float),
+    ("bump_stiffness", _BUMP_STIFFNESS_RE, int),
+    ("rebound_stiffness", _REBOUND_STIFFNESS_RE, int),
+)
+# GT3 cars have bump rubber gap
+_PROTOTYPE_CORNER_FIELDS = (
+    ("bump_rubber_gap", _BUMP_RUBBER_GAP_RE, float),
+)
+# Toe settings (varies by car); some cars have toe in fractions (e.g., TCR)
+_REAR_CORNER_FIELDS = (
+    ("toe", _TOE_IN_RE, float),
+    ("toe_fraction", _TOE_FRACTION_RE, str),
+)
+
+# Output keys such as "left_front_ride_height", built and interned once per
+# corner and field instead of formatted on every parse
+_CORNER_FIELD_KEYS = {
+    pos: {
+        field: sys.intern(f"{pos.lower().replace(' ', '_')}_{field}")
+        for field in ("start_pressure", "hot_pressure", "temps", "weight")
+        + tuple(field for field, _, _ in
+                _CORNER_FIELDS + _TOURING_CORNER_FIELDS + _PROTOTYPE_CORNER_FIELDS + _REAR_CORNER_FIELDS)
+    }
+    for pos in TIRE_POSITIONS
+}
+
+# (start pressure key, report label) per corner for generate_comparison_report
+_START_PRESSURE_ROWS = tuple((_CORNER_FIELD_KEYS[pos]["start_pressure"], pos.title()) for pos in TIRE_POSITIONS)
+
+# Brakes
+_BRAKE_BIAS_RE = re.compile(r'Brake pressure bias: <U>([0-9.]+)%</U>')
+_FRONT_MASTER_CYL_RE = re.compile(r'Front master cyl(?:inder)?: <U>([0-9.]+) in</U>')
+_REAR_MASTER_CYL_RE = re.compile(r'Rear master cyl(?:inder)?: <U>([0-9.]+) in</U>')
+_BRAKE_PADS_RE = re.compile(r'Brake pads: <U>([^<]+)</U>')
+_REAR_BRAKE_VALVE_RE = re.compile(r'Rear brake valve: <U>([0-9]+)</U>')
+_HANDBRAKE_RATIO_RE = re.compile(r'Handbrake ratio: <U>([0-9.]+):1</U>')
+
+# Differential
+_FRICTION_FACES_RE = re.compile(r'Friction Faces: <U>([0-9]+)</U>')
+_DIFF_PRELOAD_RE = re.compile(r'Diff preload: <U>([0-9]+) ft-lbs</U>')
+
+# Dampers
+_LS_COMPRESSION_RE = re.compile(r'Low Speed Compression damping: <U>([0-9]+) clicks</U>')
+_HS_COMPRESSION_RE = re.compile(r'High Speed Compression damping: <U>([0-9]+) clicks</U>')
+_LS_REBOUND_RE = re.compile(r'Low Speed Rebound damping: <U>([0-9]+) clicks</U>')
+_HS_REBOUND_RE = re.compile(r'High Speed Rebound damping: <U>([0-9]+) clicks</U>')
+
+# Damper fields searched within each FRONT/REAR DAMPERS section
+_DAMPER_FIELDS = (
+    ("low_speed_compression", _LS_COMPRESSION_RE),
+    ("high_speed_compression", _HS_COMPRESSION_RE),
+    ("low_speed_rebound", _LS_REBOUND_RE),
+    ("high_speed_rebound", _HS_REBOUND_RE),
+)
+
+# Driver aids
+_ABS_SETTING_RE = re.compile(r'ABS setting: <U>([0-9]+) \(ABS\)</U>')
+_TC_SETTING_RE = re.compile(r'TC setting: <U>([0-9]+) \([^)]+\)</U>')
+_THROTTLE_SHAPE_RE = re.compile(r'Throttle shape setting: <U>([0-9]+)</U>')
+_LAUNCH_RPM_RE = re.compile(r'Launch RPM limit: <U>([0-9]+)</U>')
+
+# Gears, fuel and weight
+_GEAR_STACK_RE = re.compile(r'Gear stack: <U>([^<]+)</U>')
+_FUEL_LEVEL_RE = re.compile(r'Fuel level: <U>([0-9.]+) gal</U>')
+_WEIGHT_DIST_RE = re.compile(r'%F WtDist: <U>([0-9.]+)%</U>')
+
+# Car type mappings based on iRacing internal names and common patterns
+CAR_TYPE_MAPPINGS = {
+    # GT3 Cars
+    "acuransxevo22gt3": "gt3_acura_nsx_evo22",
+    "porsche992rgt3": "gt3_porsche_992",
+    "ferrari296gt3": "gt3_ferrari_296", 
+    "bmwm4gt3": "gt3_bmw_m4",
+    "audiR8GT3": "gt3_audi_r8",
+    "mercedesamggt3": "gt3_mercedes_amg",
+    
+    # NASCAR
+    "nascarcup": "nascar_next_gen",
+    "nextgen": "nascar_next_gen",
+    
+    # Formula Cars
+    "dallaraF3": "f3_dallara",
+    "dallaraF2": "f2_dallara", 
+    "dallaraIR18": "indycar_ir18",
+    
+    # Touring Cars
+    "audirs3lms": "tcr_audi_rs3",
+    "hyundaiveloster": "tcr_hyundai_veloster",
+    
+    # Sports Cars
+    "porsche963gtp": "lmp_porsche_963",
+    "cadillacvr": "lmp_cadillac_vr",
+}
+
+# Track type mappings
+ROAD_COURSES = (
+    "silverstone", "spa", "nurburgring", "watkins", "road america", 
+    "sebring", "daytona road", "cota", "brands hatch", "oulton", 
+    "donnington", "snetterton", "lime rock", "laguna seca", "sonoma"
+)
+
+OVALS = (
+    "daytona", "talladega", "charlotte", "atlanta", "las vegas",
+    "texas", "kansas", "michigan", "indianapolis", "pocono",
+    "bristol", "martinsville", "richmond", "phoenix", "homestead"
+)
+
+STREET_CIRCUITS = (
+    "monaco", "long beach", "baltimore", "houston", "st pete",
+    "toronto", "detroit", "adelaide"
+)
+
+# Keyword lists compiled into single case-insensitive alternations
+_CAR_TYPE_BY_ID = {car_id.lower(): car_type for car_id, car_type in CAR_TYPE_MAPPINGS.items()}
+_CAR_ID_PRIORITY = {car_id: rank for rank, car_id in enumerate(_CAR_TYPE_BY_ID)}
+_CAR_ID_RE = re.compile('|'.join(re.escape(car_id) for car_id in _CAR_TYPE_BY_ID), re.IGNORECASE)
+_CAR_CATEGORY_RE = re.compile(r'gt3|nascar|cup|formula|f3|tcr|touring', re.IGNORECASE)
+# Generic car types for MoTeC files, keyed by filename keyword in priority order
+_MOTEC_CAR_TYPES = {
+    "gt3": "gt3_generic",
+    "nascar": "nascar_generic",
+    "tcr": "tcr_generic",
+    "formula": "formula_generic",
+}
+_MOTEC_CAR_PRIORITY = {keyword: rank for rank, keyword in enumerate(_MOTEC_CAR_TYPES)}
+_MOTEC_CAR_TYPE_RE = re.compile('|'.join(_MOTEC_CAR_TYPES))
+_ROAD_COURSE_RE = re.compile('|'.join(map(re.escape, ROAD_COURSES)))
+_OVAL_RE = re.compile('|'.join(map(re.escape, OVALS)))
+_STREET_CIRCUIT_RE = re.compile('|'.join(map(re.escape, STREET_CIRCUITS)))
+
+# Car and track detection only look at the header region of an export, and
+# results are memoized so batches of setups for the same car/track skip the scans
+@lru_cache(maxsize=DETECTION_CACHE_SIZE)
+def _detect_car_type(head: str, filename: str) -> str:
+    """Detect car type from the filename and the start of the setup file"""
+    # Files are usually named after the car, so only scan the header
+    # when the filename has no known car identifier
+    for text in (filename, head):
+        found_ids = {m.group(0).lower() for m in _CAR_ID_RE.finditer(text)}
+        if found_ids:
+            return _CAR_TYPE_BY_ID[min(found_ids, key=_CAR_ID_PRIORITY.__getitem__)]
+    
+    # Check for category indicators
+    indicators = {m.group(0).lower() for m in _CAR_CATEGORY_RE.finditer(head)}
+    if "gt3" in indicators or "gt3" in filename.lower():
+        return "gt3_generic"
+    elif "nascar" in indicators or "cup" in indicators:
+        return "nascar_next_gen" 
+    elif "formula" in indicators or "f3" in indicators:
+        return "formula_generic"
+    elif "tcr" in indicators or "touring" in indicators:
+        return "tcr_generic"
+    
+    return "unknown"
+
+@lru_cache(maxsize=DETECTION_CACHE_SIZE)
+def _detect_track_type(head: str) -> Dict[str, str]:
+    """Detect track information from the start of the setup file; callers copy the result"""
+    track_info = {"name": "unknown", "type": "unknown", "category": "unknown"}
+    
+    # Extract track name from title
+    track_match = _TRACK_NAME_RE.search(head)
+    if track_match:
+        track_name = track_match.group(1).strip()
+        track_info["name"] = track_name
+    
+    track_name_lower = track_info["name"].lower()
+    
+    if _ROAD_COURSE_RE.search(track_name_lower):
+        track_info["type"] = "road_course"
+        track_info["category"] = "permanent"
+    elif _OVAL_RE.search(track_name_lower):
+        track_info["type"] = "oval"
+        track_info["category"] = "speedway"
+    elif _STREET_CIRCUIT_RE.search(track_name_lower):
+        track_info["type"] = "street_circuit"  
+        track_info["category"] = "temporary"
+    else:
+        # Try to detect from other indicators
+        if "gp" in track_name_lower or "grand prix" in track_name_lower:
+            track_info["type"] = "road_course"
+        elif "speedway" in track_name_lower or "motor speedway" in track_name_lower:
+            track_info["type"] = "oval"
+    
+    return track_info
+
+def _json_default(obj: Any) -> Any:
+    """Serializer fallback: pandas objects become records/lists in one call, anything else str()"""
+    # pandas is imported lazily, so if it is not loaded there are no DataFrames to convert
+    pd = sys.modules.get("pandas")
+    if pd is not None:
+        if isinstance(obj, pd.DataFrame):
+            return obj.to_dict(orient="records")
+        if isinstance(obj, pd.Series):
+            return obj.to_list()
+    return str(obj)
+
+def _index_headings(content: str) -> Tuple[List[int], List[str]]:
+    """Return the end offsets and names of all section headings, in document order"""
+    offsets, names = [], []
+    for match in _SECTION_HEADING_RE.finditer(content):
+        offsets.append(match.end())
+        names.append(match.group(1))
+    return offsets, names
+
+def _first_per_corner(pattern: re.Pattern, content: str, headings: Tuple[List[int], List[str]]) -> Dict[str, re.Match]:
+    """Scan once for pattern and keep the first match under each corner heading"""
+    offsets, names = headings
+    matches = {}
+    for match in pattern.finditer(content):
+        index = bisect_right(offsets, match.start()) - 1
+        if index >= 0 and names[index] in TIRE_POSITIONS:
+            matches.setdefault(names[index], match)
+    return matches
+
+def _match_under_heading(content: str, headings: Tuple[List[int], List[str]], heading: str, pattern: re.Pattern) -> Optional[re.Match]:
+    """Match pattern directly after the first occurrence of heading where it fits"""
+    for offset, name in zip(*headings):
+        if name == heading:
+            match = pattern.match(content, offset)
+            if match:
+                return match
+    return None
+
+def _section_span(content: str, headings: Tuple[List[int], List[str]], heading: str) -> Optional[Tuple[int, int]]:
+    """Return the (start, end) offsets of the first section under heading, up to the next heading"""
+    for offset, name in zip(*headings):
+        if name == heading:
+            end = content.find('<H2>', offset)
+            return offset, end if end != -1 else len(content)
+    return None
+
+def _fastcopy(src: Union[str, Path], dst: Union[str, Path]):
+    """Copy a file and its metadata, letting the kernel move the bytes when it can"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        copiers = []
+        if hasattr(os, 'copy_file_range'):
+            copiers.append(lambda: os.copy_file_range(infd, outfd, KERNEL_COPY_BYTES))
+        if hasattr(os, 'sendfile'):
+            copiers.append(lambda: os.sendfile(outfd, infd, None, KERNEL_COPY_BYTES))
+        
+        for copy_chunk in copiers:
+            try:
+                # Some filesystems (procfs, some FUSE/overlay and cross-device paths) report
+                # end of file at offset 0 without copying; leave those to the next copier
+                if not copy_chunk() and not os.lseek(outfd, 0, os.SEEK_CUR):
+                    continue
+                while copy_chunk():
+                    pass
+                break
+            except OSError:
+                # Only fall back while nothing has been copied yet
+                if os.lseek(infd, 0, os.SEEK_CUR):
+                    raise
+        else:
+            buffer = bytearray(COPY_BUFFER_BYTES)
+            view = memoryview(buffer)
+            while size := fsrc.readinto(buffer):
+                fdst.write(view[:size])
+    shutil.copystat(src, dst)
+
+class _ComparisonView(NamedTuple):
+    """Fields of a parsed setup used by generate_comparison_report, looked up once"""
+    car_type: str
+    setup_name: Optional[str]
+    track_name: str
+    tires: Dict[str, Any]
+
+def _comparison_view(setup: Dict[str, Any]) -> _ComparisonView:
+    """Resolve the nested .get() chains for one setup"""
+    metadata = setup.get("metadata") or {}
+    parsed_data = setup.get("parsed_data") or {}
+    return _ComparisonView(metadata.get("car_type", "unknown"), setup.get("setup_name"),
+                           setup.get("track_name", "Unknown"), parsed_data.get("tires") or {})
+
+def _is_same_copy(src_stat: os.stat_result, dst_stat: os.stat_result) -> bool:
+    """True if dst already holds src: the same file, or a copy with matching size and mtime"""
+    if os.path.samestat(src_stat, dst_stat):
+        return True
+    return dst_stat.st_size == src_stat.st_size and abs(dst_stat.st_mtime - src_stat.st_mtime) < 1
+
+def _find_organized_copy(src: Path, folder: Path, organized_name: str) -> Optional[Path]:
+    """Return an existing copy of src in folder saved as '<HHMMSS>_<organized_name>', if any"""
+    try:
+        entries = os.scandir(folder)
+    except FileNotFoundError:
+        return None
+    
+    # The timestamp prefix differs between runs, so match on the stable part of the name
+    src_stat = os.stat(src)
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if (name[7:] == organized_name and name[6:7] == '_' and name[:6].isdigit()
+                    and _is_same_copy(src_stat, entry.stat())):
+                return Path(entry.path)
+    return None
 
 class SetupFileParser:
     """Parse various setup file formats used in iRacing and MoTeC"""
@@ -27,21 +457,36 @@ class SetupFileParser:
         self.processed_dir = Path("PROCESSED")
         self.vehicle_profiles = {}
         self.car_type_mappings = {}
+        self._created_dirs = set()
+        self._organized_dirs = {}
         self.load_vehicle_profiles()
         self.setup_directories()
     
     def load_vehicle_profiles(self):
-        """Load all vehicle profile JSON files"""
+        """Load all vehicle profile JSON files, reusing the pickle cache when unchanged"""
         try:
-            for profile_file in self.vehicle_profiles_dir.glob("*.json"):
-                with open(profile_file, 'r') as f:
-                    profile_data = json.load(f)
-                    category = profile_data.get("vehicle_info", {}).get("category", "unknown")
-                    self.vehicle_profiles[category] = profile_data
-                    logger.info(f"Loaded vehicle profile: {profile_file.name}")
+            load_profile_directory(self.vehicle_profiles_dir, self.vehicle_profiles)
         except Exception as e:
             logger.error(f"Error loading vehicle profiles: {e}")
     
+    def _ensure_dir(self, directory: Path):
+        """Create directory (and parents) once per parser instead of on every file"""
+        with _CREATED_DIRS_LOCK:
+            if directory in self._created_dirs:
+                return
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+    
+    def _organized_dir(self, root: str, car_type: str, date_folder: str) -> Path:
+        """Return (creating once) PROCESSED/<root>/<car_type>/<date>, reusing the Path per key"""
+        key = (root, car_type, date_folder)
+        directory = self._organized_dirs.get(key)
+        if directory is None:
+            directory = self.processed_dir / root / car_type / date_folder
+            self._ensure_dir(directory)
+            self._organized_dirs[key] = directory
+        return directory
+    
     def setup_directories(self):
         """Ensure all required directories exist"""
         directories = [
@@ -57,14 +502,14 @@ class SetupFileParser:
             directory.mkdir(parents=True, exist_ok=True)
             logger.info(f"Directory ready: {directory}")
     
-    def parse_iracing_htm(self, htm_file_path: str) -> Dict[str, Any]:
+    def parse_iracing_htm(self, htm_file_path: Union[str, Path]) -> Dict[str, Any]:
         """Parse iRacing .htm setup export file"""
+        # Paths are accepted anywhere; the parsed data keeps file_path as a plain str
+        htm_file_path = os.fspath(htm_file_path)
         try:
-            with open(htm_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse HTML content
-            soup = BeautifulSoup(content, 'html.parser')
+            # Read raw bytes and decode once; the regexes don't need newline translation
+            with open(htm_file_path, 'rb') as f:
+                content = f.read().decode('utf-8', errors='replace')
             
             # Extract setup data
             setup_data = {
@@ -75,7 +520,7 @@ class SetupFileParser:
             }
             
             # Extract car and track info from title
-            title_match = re.search(r'(\w+) setup: (.+?)<br>\s*track: (.+?)</H2>', content)
+            title_match = _TITLE_RE.search(content)
             if title_match:
                 setup_data["car_name"] = title_match.group(1)
                 setup_data["setup_name"] = title_match.group(2)
@@ -88,19 +533,22 @@ class SetupFileParser:
             setup_data["metadata"] = {
                 "car_type": car_type,
                 "track_info": track_info,
-                "parsing_timestamp": str(pd.Timestamp.now())
+                "parsing_timestamp": datetime.now(timezone.utc).isoformat()
             }
             
-            # Parse different sections based on car type
-            setup_data["parsed_data"]["tires"] = self._parse_tire_section(content, car_type)
-            setup_data["parsed_data"]["aerodynamics"] = self._parse_aero_section(content, car_type)
-            setup_data["parsed_data"]["suspension"] = self._parse_suspension_section(content, car_type)
-            setup_data["parsed_data"]["brakes"] = self._parse_brake_section(content, car_type)
-            setup_data["parsed_data"]["differential"] = self._parse_diff_section(content, car_type)
-            setup_data["parsed_data"]["dampers"] = self._parse_damper_section(content, car_type)
-            setup_data["parsed_data"]["driver_aids"] = self._parse_driver_aids_section(content, car_type)
-            setup_data["parsed_data"]["gears"] = self._parse_gear_section(content, car_type)
-            setup_data["parsed_data"]["fuel_weight"] = self._parse_fuel_weight_section(content, car_type)
+            # Index section headings once for the corner and damper fields
+            headings = _index_headings(content)
+            
+            # Parse different sections based on car type; sections whose anchor
+            # text never appears are left empty without running any of their patterns
+            parsed_data = setup_data["parsed_data"]
+            for section, parser, uses_headings in self._SECTION_PARSERS:
+                if not any(anchor in content for anchor in SECTION_ANCHORS[section]):
+                    parsed_data[section] = {}
+                elif uses_headings:
+                    parsed_data[section] = parser(self, content, car_type, headings)
+                else:
+                    parsed_data[section] = parser(self, content, car_type)
             
             return setup_data
             
@@ -108,32 +556,54 @@ class SetupFileParser:
             logger.error(f"Error parsing iRacing .htm file {htm_file_path}: {e}")
             return {"error": str(e)}
     
-    def _parse_tire_section(self, content: str, car_type: str = "unknown") -> Dict[str, Any]:
+    def parse_directory(self, directory: Union[str, Path], pattern: str = "*.htm",
+                        max_workers: Optional[int] = None, use_processes: bool = True) -> List[Dict[str, Any]]:
+        """Parse every iRacing .htm export in a directory in parallel
+        
+        Files are parsed in a process pool by default; use_processes=False switches
+        to threads, which avoids pickling the parser for small or I/O-bound batches.
+        Results are returned in sorted filename order.
+        """
+        file_paths = [str(path) for path in sorted(Path(directory).glob(pattern))]
+        if len(file_paths) < 2:
+            return [self.parse_iracing_htm(path) for path in file_paths]
+        
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=max_workers) as executor:
+            return list(executor.map(self.parse_iracing_htm, file_paths, chunksize=PARSE_CHUNK_FILES))
+    
+    def _parse_tire_section(self, content: str, car_type: str = "unknown",
+                            headings: Optional[Tuple[List[int], List[str]]] = None) -> Dict[str, Any]:
         """Parse tire pressure and temperature data"""
+        if headings is None:
+            headings = _index_headings(content)
         tire_data = {}
         
+        # One scan per field covers all four tires
+        hot_pressures = _first_per_corner(_HOT_PRESSURE_RE, content, headings)
+        temps = _first_per_corner(_TIRE_TEMPS_RE, content, headings)
+        
         # Extract tire pressures
-        tire_positions = ['LEFT FRONT', 'RIGHT FRONT', 'LEFT REAR', 'RIGHT REAR']
-        for pos in tire_positions:
-            pos_key = pos.lower().replace(' ', '_')
+        for pos in TIRE_POSITIONS:
+            pos_keys = _CORNER_FIELD_KEYS[pos]
             
             # Find starting pressure
-            start_pressure_match = re.search(rf'<H2><U>{pos}:</U></H2>\s*Starting pressure: <U>([0-9.]+) psi</U>', content)
+            start_pressure_match = _match_under_heading(content, headings, pos, _START_PRESSURE_RE)
             if start_pressure_match:
-                tire_data[f"{pos_key}_start_pressure"] = float(start_pressure_match.group(1))
+                tire_data[pos_keys["start_pressure"]] = float(start_pressure_match.group(1))
             
             # Find hot pressure
-            hot_pressure_match = re.search(rf'Starting pressure: <U>[0-9.]+ psi</U><br>Last hot pressure: <U>([0-9.]+) psi</U>', content)
+            hot_pressure_match = hot_pressures.get(pos)
             if hot_pressure_match:
-                tire_data[f"{pos_key}_hot_pressure"] = float(hot_pressure_match.group(1))
+                tire_data[pos_keys["hot_pressure"]] = float(hot_pressure_match.group(1))
             
             # Find temperatures (O M I or I M O pattern)
-            temp_match = re.search(rf'Last temps [OMI ]+: <U>([0-9]+)F</U><br><U>([0-9]+)F</U><br><U>([0-9]+)F</U>', content)
+            temp_match = temps.get(pos)
             if temp_match:
-                tire_data[f"{pos_key}_temps"] = [int(temp_match.group(1)), int(temp_match.group(2)), int(temp_match.group(3))]
+                tire_data[pos_keys["temps"]] = [int(temp_match.group(1)), int(temp_match.group(2)), int(temp_match.group(3))]
         
         # Extract tire type (Dry/Wet/etc.)
-        tire_type_match = re.search(r'Tire type: <U>([^<]+)</U>', content)
+        tire_type_match = _TIRE_TYPE_RE.search(content)
         if tire_type_match:
             tire_data["tire_type"] = tire_type_match.group(1)
         
@@ -146,148 +616,122 @@ class SetupFileParser:
         # GT3 and sports cars typically have these
         if "gt3" in car_type or "lmp" in car_type or "formula" in car_type:
             # Rear wing angle
-            wing_match = re.search(r'(?:Rear )?Wing (?:setting|angle): <U>([0-9.-]+) degrees</U>', content)
+            wing_match = _WING_ANGLE_RE.search(content)
             if wing_match:
                 aero_data["rear_wing_angle"] = float(wing_match.group(1))
             
             # Front splitter height
-            splitter_match = re.search(r'(?:Center )?(?:front )?[Ss]plitter height:? <U>([0-9.]+) in</U>', content)
+            splitter_match = _SPLITTER_HEIGHT_RE.search(content)
             if splitter_match:
                 aero_data["front_splitter_height"] = float(splitter_match.group(1))
             
             # Ride heights at speed
-            front_rh_match = re.search(r'Front RH at speed: <U>([0-9.]+)"</U>', content)
+            front_rh_match = _FRONT_RH_AT_SPEED_RE.search(content)
             if front_rh_match:
                 aero_data["front_rh_at_speed"] = float(front_rh_match.group(1))
             
-            rear_rh_match = re.search(r'Rear RH at speed: <U>([0-9.]+)"</U>', content)
+            rear_rh_match = _REAR_RH_AT_SPEED_RE.search(content)
             if rear_rh_match:
                 aero_data["rear_rh_at_speed"] = float(rear_rh_match.group(1))
             
             # Front downforce percentage
-            df_match = re.search(r'Front downforce: <U>([0-9.]+)%</U>', content)
+            df_match = _FRONT_DOWNFORCE_RE.search(content)
             if df_match:
                 aero_data["front_downforce_percent"] = float(df_match.group(1))
         
         # NASCAR specific aero
         elif "nascar" in car_type:
             # NASCAR has different aero parameters
-            spoiler_match = re.search(r'Rear spoiler: <U>([0-9.]+) (?:degrees|in)</U>', content)
+            spoiler_match = _REAR_SPOILER_RE.search(content)
             if spoiler_match:
                 aero_data["rear_spoiler"] = float(spoiler_match.group(1))
             
-            splitter_match = re.search(r'Front splitter: <U>([0-9.]+) (?:degrees|in)</U>', content)
+            splitter_match = _FRONT_SPLITTER_RE.search(content)
             if splitter_match:
                 aero_data["front_splitter"] = float(splitter_match.group(1))
         
         # Touring cars might have different patterns
         elif "tcr" in car_type or "touring" in car_type:
             # TCR cars often have rear wing settings
-            wing_match = re.search(r'Rear Wing setting: <U>([+-]?[0-9.]+) degrees</U>', content)
+            wing_match = _TCR_WING_SETTING_RE.search(content)
             if wing_match:
                 aero_data["rear_wing_angle"] = float(wing_match.group(1))
         
         return aero_data
     
-    def _parse_suspension_section(self, content: str, car_type: str = "unknown") -> Dict[str, Any]:
+    def _parse_suspension_section(self, content: str, car_type: str = "unknown",
+                                  headings: Optional[Tuple[List[int], List[str]]] = None) -> Dict[str, Any]:
         """Parse suspension setup data"""
+        if headings is None:
+            headings = _index_headings(content)
         suspension_data = {}
-        
-        # Corner weights, ride heights, spring rates, camber
-        corners = ['LEFT FRONT', 'RIGHT FRONT', 'LEFT REAR', 'RIGHT REAR']
-        for corner in corners:
-            corner_key = corner.lower().replace(' ', '_')
+        is_touring = "tcr" in car_type or "touring" in car_type
+        is_prototype = "gt3" in car_type or "lmp" in car_type
+        
+        # Ride heights, spring rates, camber, plus car-specific corner fields
+        corner_fields = _CORNER_FIELDS
+        if is_touring:
+            corner_fields += _TOURING_CORNER_FIELDS
+        elif is_prototype:
+            corner_fields += _PROTOTYPE_CORNER_FIELDS
+        
+        # Per-field scans, keyed by corner
+        corner_matches = [(field, _first_per_corner(pattern, content, headings), convert)
+                          for field, pattern, convert in corner_fields]
+        rear_matches = [(field, _first_per_corner(pattern, content, headings), convert)
+                        for field, pattern, convert in _REAR_CORNER_FIELDS]
+        
+        for corner in TIRE_POSITIONS:
+            corner_keys = _CORNER_FIELD_KEYS[corner]
             
             # Corner weight
-            weight_match = re.search(rf'<H2><U>{corner}:</U></H2>\s*Corner weight: <U>([0-9]+) lbs</U>', content)
+            weight_match = _match_under_heading(content, headings, corner, _CORNER_WEIGHT_RE)
             if weight_match:
-                suspension_data[f"{corner_key}_weight"] = int(weight_match.group(1))
-            
-            # Ride height
-            rh_match = re.search(rf'Ride height: <U>([0-9.]+) in</U>', content)
-            if rh_match:
-                suspension_data[f"{corner_key}_ride_height"] = float(rh_match.group(1))
-            
-            # Spring rate
-            spring_match = re.search(rf'Spring rate: <U>([0-9]+) lbs/in</U>', content)
-            if spring_match:
-                suspension_data[f"{corner_key}_spring_rate"] = int(spring_match.group(1))
-            
-            # Camber
-            camber_match = re.search(rf'Camber: <U>([+-][0-9.]+) deg</U>', content)
-            if camber_match:
-                suspension_data[f"{corner_key}_camber"] = float(camber_match.group(1))
-            
-            # Car-specific suspension parameters
-            if "tcr" in car_type or "touring" in car_type:
-                # TCR cars often have spring perch offset
-                perch_match = re.search(rf'Spring perch offset: <U>([0-9.]+)"</U>', content)
-                if perch_match:
-                    suspension_data[f"{corner_key}_spring_perch_offset"] = float(perch_match.group(1))
-                
-                # TCR damper settings are different (bump/rebound stiffness)
-                bump_match = re.search(rf'Bump stiffness: <U>([+-][0-9]+) clicks</U>', content)
-                if bump_match:
-                    suspension_data[f"{corner_key}_bump_stiffness"] = int(bump_match.group(1))
-                
-                rebound_match = re.search(rf'Rebound stiffness: <U>([+-][0-9]+) clicks</U>', content)
-                if rebound_match:
-                    suspension_data[f"{corner_key}_rebound_stiffness"] = int(rebound_match.group(1))
-            
-            elif "gt3" in car_type or "lmp" in car_type:
-                # GT3 cars have bump rubber gap
-                bump_rubber_match = re.search(rf'Bump rubber gap: <U>([0-9.]+) in</U>', content)
-                if bump_rubber_match:
-                    suspension_data[f"{corner_key}_bump_rubber_gap"] = float(bump_rubber_match.group(1))
-            
-            # Toe settings (varies by car)
-            if 'REAR' in corner:
-                toe_match = re.search(rf'Toe-in: <U>([+-][0-9.]+) in</U>', content)
-                if toe_match:
-                    suspension_data[f"{corner_key}_toe"] = float(toe_match.group(1))
-                
-                # Some cars have toe in fractions (e.g., TCR)
-                toe_fraction_match = re.search(rf'Toe-in: <U>([+-]?[0-9]+)/32"</U>', content)
-                if toe_fraction_match:
-                    suspension_data[f"{corner_key}_toe_fraction"] = toe_fraction_match.group(1)
+                suspension_data[corner_keys["weight"]] = int(weight_match.group(1))
+            
+            fields = corner_matches + rear_matches if 'REAR' in corner else corner_matches
+            for field, matches, convert in fields:
+                match = matches.get(corner)
+                if match:
+                    suspension_data[corner_keys[field]] = convert(match.group(1))
         
         # Front total toe
-        front_toe_match = re.search(r'Total toe-in: <U>([+-][0-9.]+) in</U>', content)
+        front_toe_match = _TOTAL_TOE_IN_RE.search(content)
         if front_toe_match:
             suspension_data["front_total_toe"] = float(front_toe_match.group(1))
         
         # Front toe fraction format (e.g., TCR)
-        front_toe_fraction_match = re.search(r'Toe-in: <U>([+-]?[0-9]+)/32"</U>', content)
-        if front_toe_fraction_match:
-            suspension_data["front_toe_fraction"] = front_toe_fraction_match.group(1)
+        toe_fraction_match = _TOE_FRACTION_RE.search(content)
+        if toe_fraction_match:
+            suspension_data["front_toe_fraction"] = toe_fraction_match.group(1)
         
         # Anti-roll bar settings (varies by car type)
-        if "gt3" in car_type or "lmp" in car_type:
+        if is_prototype:
             # GT3 typically has ARB settings as numbers
-            front_arb_match = re.search(r'ARB setting: <U>([0-9]+)</U>', content)
+            front_arb_match = _FRONT_ARB_SETTING_RE.search(content)
             if front_arb_match:
                 suspension_data["front_arb_setting"] = int(front_arb_match.group(1))
             
-            rear_arb_match = re.search(r'RARB setting: <U>([0-9]+)</U>', content)
+            rear_arb_match = _REAR_ARB_SETTING_RE.search(content)
             if rear_arb_match:
                 suspension_data["rear_arb_setting"] = int(rear_arb_match.group(1))
         
-        elif "tcr" in car_type or "touring" in car_type:
+        elif is_touring:
             # TCR has ARB wall thickness and blade length
-            front_arb_thickness_match = re.search(r'Anti-roll bar wall thickness: <U>([0-9.]+)"</U>', content)
+            front_arb_thickness_match = _ARB_WALL_THICKNESS_RE.search(content)
             if front_arb_thickness_match:
                 suspension_data["front_arb_wall_thickness"] = float(front_arb_thickness_match.group(1))
             
-            front_arb_blade_match = re.search(r'Anti-roll bar blade length: <U>([0-9.]+)"</U>', content)
+            front_arb_blade_match = _ARB_BLADE_LENGTH_RE.search(content)
             if front_arb_blade_match:
                 suspension_data["front_arb_blade_length"] = float(front_arb_blade_match.group(1))
         
         # Weight distribution parameters
-        nose_weight_match = re.search(r'Nose weight: <U>([0-9.]+)%</U>', content)
+        nose_weight_match = _NOSE_WEIGHT_RE.search(content)
         if nose_weight_match:
             suspension_data["nose_weight_percent"] = float(nose_weight_match.group(1))
         
-        cross_weight_match = re.search(r'Cross weight: <U>([0-9.]+)%</U>', content)
+        cross_weight_match = _CROSS_WEIGHT_RE.search(content)
         if cross_weight_match:
             suspension_data["cross_weight_percent"] = float(cross_weight_match.group(1))
         
@@ -298,33 +742,33 @@ class SetupFileParser:
         brake_data = {}
         
         # Brake bias
-        bias_match = re.search(r'Brake pressure bias: <U>([0-9.]+)%</U>', content)
+        bias_match = _BRAKE_BIAS_RE.search(content)
         if bias_match:
             brake_data["brake_bias"] = float(bias_match.group(1))
         
         # Master cylinder diameters
-        front_mc_match = re.search(r'Front master cyl(?:inder)?: <U>([0-9.]+) in</U>', content)
+        front_mc_match = _FRONT_MASTER_CYL_RE.search(content)
         if front_mc_match:
             brake_data["front_master_cylinder"] = float(front_mc_match.group(1))
         
-        rear_mc_match = re.search(r'Rear master cyl(?:inder)?: <U>([0-9.]+) in</U>', content)
+        rear_mc_match = _REAR_MASTER_CYL_RE.search(content)
         if rear_mc_match:
             brake_data["rear_master_cylinder"] = float(rear_mc_match.group(1))
         
         # Brake pads
-        pad_match = re.search(r'Brake pads: <U>([^<]+)</U>', content)
+        pad_match = _BRAKE_PADS_RE.search(content)
         if pad_match:
             brake_data["brake_pads"] = pad_match.group(1)
         
         # TCR-specific brake parameters
         if "tcr" in car_type or "touring" in car_type:
             # Rear brake valve
-            valve_match = re.search(r'Rear brake valve: <U>([0-9]+)</U>', content)
+            valve_match = _REAR_BRAKE_VALVE_RE.search(content)
             if valve_match:
                 brake_data["rear_brake_valve"] = int(valve_match.group(1))
             
             # Handbrake ratio
-            handbrake_match = re.search(r'Handbrake ratio: <U>([0-9.]+):1</U>', content)
+            handbrake_match = _HANDBRAKE_RATIO_RE.search(content)
             if handbrake_match:
                 brake_data["handbrake_ratio"] = float(handbrake_match.group(1))
         
@@ -335,56 +779,36 @@ class SetupFileParser:
         diff_data = {}
         
         # Friction faces
-        faces_match = re.search(r'Friction Faces: <U>([0-9]+)</U>', content)
+        faces_match = _FRICTION_FACES_RE.search(content)
         if faces_match:
             diff_data["friction_faces"] = int(faces_match.group(1))
         
         # Differential preload
-        preload_match = re.search(r'Diff preload: <U>([0-9]+) ft-lbs</U>', content)
+        preload_match = _DIFF_PRELOAD_RE.search(content)
         if preload_match:
             diff_data["diff_preload"] = int(preload_match.group(1))
         
         return diff_data
     
-    def _parse_damper_section(self, content: str, car_type: str = "unknown") -> Dict[str, Any]:
+    def _parse_damper_section(self, content: str, car_type: str = "unknown",
+                              headings: Optional[Tuple[List[int], List[str]]] = None) -> Dict[str, Any]:
         """Parse damper setup data"""
+        if headings is None:
+            headings = _index_headings(content)
         damper_data = {}
         
-        # GT3/LMP style dampers
+        # GT3/LMP style dampers; each side's fields are searched only within
+        # its own section so rear values are not taken from the front block
         if "gt3" in car_type or "lmp" in car_type:
-            # Front dampers
-            front_lsc_match = re.search(r'<H2><U>FRONT DAMPERS:</U></H2>\s*Low Speed Compression damping: <U>([0-9]+) clicks</U>', content)
-            if front_lsc_match:
-                damper_data["front_low_speed_compression"] = int(front_lsc_match.group(1))
-            
-            front_hsc_match = re.search(r'High Speed Compression damping: <U>([0-9]+) clicks</U>', content)
-            if front_hsc_match:
-                damper_data["front_high_speed_compression"] = int(front_hsc_match.group(1))
-            
-            front_lsr_match = re.search(r'Low Speed Rebound damping: <U>([0-9]+) clicks</U>', content)
-            if front_lsr_match:
-                damper_data["front_low_speed_rebound"] = int(front_lsr_match.group(1))
-            
-            front_hsr_match = re.search(r'High Speed Rebound damping: <U>([0-9]+) clicks</U>', content)
-            if front_hsr_match:
-                damper_data["front_high_speed_rebound"] = int(front_hsr_match.group(1))
-            
-            # Rear dampers
-            rear_lsc_match = re.search(r'<H2><U>REAR DAMPERS:</U></H2>\s*Low Speed Compression damping: <U>([0-9]+) clicks</U>', content)
-            if rear_lsc_match:
-                damper_data["rear_low_speed_compression"] = int(rear_lsc_match.group(1))
-            
-            rear_hsc_match = re.search(r'High Speed Compression damping: <U>([0-9]+) clicks</U>', content)
-            if rear_hsc_match:
-                damper_data["rear_high_speed_compression"] = int(rear_hsc_match.group(1))
-            
-            rear_lsr_match = re.search(r'Low Speed Rebound damping: <U>([0-9]+) clicks</U>', content)
-            if rear_lsr_match:
-                damper_data["rear_low_speed_rebound"] = int(rear_lsr_match.group(1))
-            
-            rear_hsr_match = re.search(r'High Speed Rebound damping: <U>([0-9]+) clicks</U>', content)
-            if rear_hsr_match:
-                damper_data["rear_high_speed_rebound"] = int(rear_hsr_match.group(1))
+            for side, heading in (("front", "FRONT DAMPERS"), ("rear", "REAR DAMPERS")):
+                span = _section_span(content, headings, heading)
+                if span is None:
+                    continue
+                start, end = span
+                for field, pattern in _DAMPER_FIELDS:
+                    match = pattern.search(content, start, end)
+                    if match:
+                        damper_data[f"{side}_{field}"] = int(match.group(1))
         
         # TCR style dampers are handled in suspension section as bump/rebound stiffness
         
@@ -395,26 +819,26 @@ class SetupFileParser:
         aids_data = {}
         
         # ABS setting
-        abs_match = re.search(r'ABS setting: <U>([0-9]+) \(ABS\)</U>', content)
+        abs_match = _ABS_SETTING_RE.search(content)
         if abs_match:
             aids_data["abs_setting"] = int(abs_match.group(1))
         
         # TC setting
-        tc_match = re.search(r'TC setting: <U>([0-9]+) \([^)]+\)</U>', content)
+        tc_match = _TC_SETTING_RE.search(content)
         if tc_match:
             aids_data["tc_setting"] = int(tc_match.group(1))
         
         # GT3-specific aids
         if "gt3" in car_type:
             # Throttle shape
-            throttle_match = re.search(r'Throttle shape setting: <U>([0-9]+)</U>', content)
+            throttle_match = _THROTTLE_SHAPE_RE.search(content)
             if throttle_match:
                 aids_data["throttle_shape"] = int(throttle_match.group(1))
         
         # TCR-specific aids
         if "tcr" in car_type or "touring" in car_type:
             # Launch RPM limit
-            launch_match = re.search(r'Launch RPM limit: <U>([0-9]+)</U>', content)
+            launch_match = _LAUNCH_RPM_RE.search(content)
             if launch_match:
                 aids_data["launch_rpm_limit"] = int(launch_match.group(1))
         
@@ -425,7 +849,7 @@ class SetupFileParser:
         gear_data = {}
         
         # Gear stack
-        gear_match = re.search(r'Gear stack: <U>([^<]+)</U>', content)
+        gear_match = _GEAR_STACK_RE.search(content)
         if gear_match:
             gear_data["gear_stack"] = gear_match.group(1)
         
@@ -436,27 +860,50 @@ class SetupFileParser:
         fuel_weight_data = {}
         
         # Fuel level
-        fuel_match = re.search(r'Fuel level: <U>([0-9.]+) gal</U>', content)
+        fuel_match = _FUEL_LEVEL_RE.search(content)
         if fuel_match:
             fuel_weight_data["fuel_level"] = float(fuel_match.group(1))
         
         # Weight distribution
-        weight_dist_match = re.search(r'%F WtDist: <U>([0-9.]+)%</U>', content)
+        weight_dist_match = _WEIGHT_DIST_RE.search(content)
         if weight_dist_match:
             fuel_weight_data["front_weight_dist"] = float(weight_dist_match.group(1))
         
         # Cross weight
-        cross_weight_match = re.search(r'Cross weight: <U>([0-9.]+)%</U>', content)
+        cross_weight_match = _CROSS_WEIGHT_RE.search(content)
         if cross_weight_match:
             fuel_weight_data["cross_weight"] = float(cross_weight_match.group(1))
         
         return fuel_weight_data
     
-    def parse_motec_csv(self, csv_file_path: str) -> Dict[str, Any]:
-        """Parse MoTeC setup sheet CSV file"""
+    # Section parsers in output order, as (section, parser, takes heading index)
+    _SECTION_PARSERS = (
+        ("tires", _parse_tire_section, True),
+        ("aerodynamics", _parse_aero_section, False),
+        ("suspension", _parse_suspension_section, True),
+        ("brakes", _parse_brake_section, False),
+        ("differential", _parse_diff_section, False),
+        ("dampers", _parse_damper_section, True),
+        ("driver_aids", _parse_driver_aids_section, False),
+        ("gears", _parse_gear_section, False),
+        ("fuel_weight", _parse_fuel_weight_section, False),
+    )
+    
+    def parse_motec_csv(self, csv_file_path: Union[str, Path], include_values: bool = True,
+                        parameters: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Parse MoTeC setup sheet CSV file
+        
+        Parameter names and units are read from the first two rows; value rows are
+        then streamed in chunks. Pass include_values=False when only names and units
+        are needed, or parameters to read just those columns.
+        """
+        csv_file_path = os.fspath(csv_file_path)
         try:
-            # Read CSV file
-            df = pd.read_csv(csv_file_path)
+            # pandas is only needed for MoTeC sheets, so it is imported on first use
+            import pandas as pd
+            
+            # Read only the parameter name and unit rows
+            head = pd.read_csv(csv_file_path, nrows=2, dtype=str)
             
             setup_data = {
                 "file_type": "motec_csv",
@@ -465,26 +912,29 @@ class SetupFileParser:
             }
             
             # Parse header to get parameter names and units
-            if len(df) > 0:
-                header_row = df.iloc[0]  # Parameter names
-                unit_row = df.iloc[1] if len(df) > 1 else None  # Units
+            if len(head) > 0:
+                header_row = head.iloc[0].to_numpy()  # Parameter names
+                unit_row = head.iloc[1].to_numpy() if len(head) > 1 else None  # Units
+                
+                # Map each parameter to its column; a repeated name keeps the last column
+                param_columns = {}
+                for j, param_name in enumerate(header_row):
+                    if pd.notna(param_name) and param_name != '' and (parameters is None or param_name in parameters):
+                        param_columns[param_name] = j
                 
-                # Extract parameters
-                for col in df.columns:
-                    if pd.notna(header_row[col]) and header_row[col] != '':
-                        param_name = header_row[col]
-                        unit = unit_row[col] if unit_row is not None and pd.notna(unit_row[col]) else ''
-                        
-                        setup_data["parsed_data"][param_name] = {
-                            "unit": unit,
-                            "values": []
-                        }
-                        
-                        # Extract values from subsequent rows
-                        for i in range(2, len(df)):
-                            value = df.iloc[i][col]
-                            if pd.notna(value) and value != '':
-                                setup_data["parsed_data"][param_name]["values"].append(value)
+                for param_name, j in param_columns.items():
+                    unit = unit_row[j] if unit_row is not None and pd.notna(unit_row[j]) else ''
+                    setup_data["parsed_data"][param_name] = {
+                        "unit": unit,
+                        "values": []
+                    }
+                
+                # Stream the value rows, reading only the selected columns
+                if include_values and unit_row is not None and param_columns:
+                    columns = sorted(param_columns.values())
+                    values = self._read_motec_csv_values(csv_file_path, columns, len(header_row))
+                    for j, column_values in zip(columns, values):
+                        setup_data["parsed_data"][header_row[j]]["values"] = column_values
             
             return setup_data
             
@@ -492,9 +942,58 @@ class SetupFileParser:
             logger.error(f"Error parsing MoTeC CSV file {csv_file_path}: {e}")
             return {"error": str(e)}
     
-    def parse_motec_excel(self, excel_file_path: str) -> Dict[str, Any]:
+    def _read_motec_csv_values(self, csv_file_path: str, columns: List[int], column_count: int) -> List[List[Any]]:
+        """Return the non-empty values below the header rows for each selected column"""
+        try:
+            return self._read_motec_csv_values_arrow(csv_file_path, columns, column_count)
+        except ImportError:
+            pass  # pyarrow is optional
+        except Exception as e:
+            logger.warning(f"Arrow CSV reader failed for {csv_file_path}, using pandas: {e}")
+        
+        import pandas as pd
+        values = [[] for _ in columns]
+        reader = pd.read_csv(csv_file_path, skiprows=[1, 2], usecols=columns,
+                             dtype=str, chunksize=MOTEC_CSV_CHUNK_ROWS)
+        for chunk in reader:
+            body = chunk.to_numpy()
+            for k in range(len(columns)):
+                column = body[:, k]
+                mask = pd.notna(column) & (column != '')
+                values[k].extend(column[mask].tolist())
+        return values
+    
+    @staticmethod
+    def _read_motec_csv_values_arrow(csv_file_path: str, columns: List[int], column_count: int) -> List[List[Any]]:
+        """Stream the value rows with pyarrow's CSV reader as string columns"""
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        
+        # Positional names sidestep duplicate or blank headers in the first line
+        names = [f"c{j}" for j in range(column_count)]
+        selected = [names[j] for j in columns]
+        reader = pa_csv.open_csv(
+            csv_file_path,
+            read_options=pa_csv.ReadOptions(skip_rows=3, column_names=names,
+                                            block_size=MOTEC_CSV_BLOCK_BYTES),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in selected},
+                include_columns=selected,
+                strings_can_be_null=True,
+            ),
+        )
+        values = [[] for _ in columns]
+        for batch in reader:
+            for k in range(len(columns)):
+                values[k].extend(batch.column(k).drop_null().to_pylist())
+        return values
+    
+    def parse_motec_excel(self, excel_file_path: Union[str, Path]) -> Dict[str, Any]:
         """Parse MoTeC setup sheet Excel file"""
+        excel_file_path = os.fspath(excel_file_path)
         try:
+            import pandas as pd
+            
             # Read Excel file
             df = pd.read_excel(excel_file_path)
             
@@ -515,101 +1014,31 @@ class SetupFileParser:
     
     def detect_car_type(self, content: str, filename: str = "") -> str:
         """Detect car type from setup file content"""
-        content_lower = content.lower()
-        filename_lower = filename.lower()
-        
-        # Car type mappings based on iRacing internal names and common patterns
-        car_mappings = {
-            # GT3 Cars
-            "acuransxevo22gt3": "gt3_acura_nsx_evo22",
-            "porsche992rgt3": "gt3_porsche_992",
-            "ferrari296gt3": "gt3_ferrari_296", 
-            "bmwm4gt3": "gt3_bmw_m4",
-            "audiR8GT3": "gt3_audi_r8",
-            "mercedesamggt3": "gt3_mercedes_amg",
-            
-            # NASCAR
-            "nascarcup": "nascar_next_gen",
-            "nextgen": "nascar_next_gen",
-            
-            # Formula Cars
-            "dallaraF3": "f3_dallara",
-            "dallaraF2": "f2_dallara", 
-            "dallaraIR18": "indycar_ir18",
-            
-            # Touring Cars
-            "audirs3lms": "tcr_audi_rs3",
-            "hyundaiveloster": "tcr_hyundai_veloster",
-            
-            # Sports Cars
-            "porsche963gtp": "lmp_porsche_963",
-            "cadillacvr": "lmp_cadillac_vr",
-        }
-        
-        # Check content for car identifiers
-        for car_id, car_type in car_mappings.items():
-            if car_id.lower() in content_lower or car_id.lower() in filename_lower:
-                return car_type
-        
-        # Check for category indicators
-        if "gt3" in content_lower or "gt3" in filename_lower:
-            return "gt3_generic"
-        elif "nascar" in content_lower or "cup" in content_lower:
-            return "nascar_next_gen" 
-        elif "formula" in content_lower or "f3" in content_lower:
-            return "formula_generic"
-        elif "tcr" in content_lower or "touring" in content_lower:
-            return "tcr_generic"
-        
-        return "unknown"
+        return _detect_car_type(content[:DETECTION_HEAD_CHARS], filename)
     
     def detect_track_type(self, content: str) -> Dict[str, str]:
         """Detect track information from setup file content"""
-        track_info = {"name": "unknown", "type": "unknown", "category": "unknown"}
-        
-        # Extract track name from title
-        track_match = re.search(r'track: ([^<]+)', content, re.IGNORECASE)
-        if track_match:
-            track_name = track_match.group(1).strip()
-            track_info["name"] = track_name
-        
-        # Track type mappings
-        road_courses = [
-            "silverstone", "spa", "nurburgring", "watkins", "road america", 
-            "sebring", "daytona road", "cota", "brands hatch", "oulton", 
-            "donnington", "snetterton", "lime rock", "laguna seca", "sonoma"
-        ]
-        
-        ovals = [
-            "daytona", "talladega", "charlotte", "atlanta", "las vegas",
-            "texas", "kansas", "michigan", "indianapolis", "pocono",
-            "bristol", "martinsville", "richmond", "phoenix", "homestead"
-        ]
-        
-        street_circuits = [
-            "monaco", "long beach", "baltimore", "houston", "st pete",
-            "toronto", "detroit", "adelaide"
-        ]
-        
-        track_name_lower = track_info["name"].lower();
-        
-        if any(track in track_name_lower for track in road_courses):
-            track_info["type"] = "road_course"
-            track_info["category"] = "permanent"
-        elif any(track in track_name_lower for track in ovals):
-            track_info["type"] = "oval"
-            track_info["category"] = "speedway"
-        elif any(track in track_name_lower for track in street_circuits):
-            track_info["type"] = "street_circuit"  
-            track_info["category"] = "temporary"
-        else:
-            # Try to detect from other indicators
-            if "gp" in track_name_lower or "grand prix" in track_name_lower:
-                track_info["type"] = "road_course"
-            elif "speedway" in track_name_lower or "motor speedway" in track_name_lower:
-                track_info["type"] = "oval"
-        
-        return track_info
+        return dict(_detect_track_type(content[:DETECTION_HEAD_CHARS]))
+    
+    def to_json(self, setup_data: Dict[str, Any], indent: bool = False) -> bytes:
+        """Serialize parsed setup data to JSON bytes, using orjson when it is installed"""
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(setup_data, default=_json_default, option=option)
+        return json.dumps(setup_data, indent=2 if indent else None, default=_json_default).encode("utf-8")
+    
+    def _write_json(self, json_path: Path, data: Dict[str, Any]):
+        """Write parsed data to json_path without building intermediate text copies"""
+        if orjson is not None:
+            json_path.write_bytes(self.to_json(data, indent=True))
+            return
+        # The stdlib encoder streams into the file; indentation is skipped because
+        # it multiplies the transient strings built for large MoTeC payloads, and
+        # the large buffer turns its per-token write() calls into a few syscalls
+        with open(json_path, 'w', buffering=COPY_BUFFER_BYTES) as f:
+            json.dump(data, f, default=_json_default)
     
     def compare_setups(self, setup1: Dict[str, Any], setup2: Dict[str, Any]) -> Dict[str, Any]:
         """Compare two parsed setup files"""
@@ -672,53 +1101,117 @@ class SetupFileParser:
         
         for section_name, section_data in parsed_data.items():
             if section_data:
-                report.append(f"{section_name.upper().replace('_', ' ')}:")
+                report.append(f"{section_title(section_name)}:")
                 report.append("-" * 40)
                 
                 if isinstance(section_data, dict):
                     for param, value in section_data.items():
-                        report.append(f"  {param.replace('_', ' ').title()}: {value}")
+                        report.append(f"  {pretty_label(param)}: {value}")
                 
                 report.append("")
         
         return "\n".join(report)
     
-    def process_drop_off_files(self) -> List[Dict[str, Any]]:
-        """Process all files in the DROP-OFF folder"""
-        processed_files = []
+    def process_drop_off_files(self, max_workers: Optional[int] = None,
+                               archive: bool = False) -> List[Dict[str, Any]]:
+        """Process all files in the DROP-OFF folder, parsing and organizing files concurrently
+        
+        With archive=True the per-file *_parsed.json files are not written; every
+        parsed result is instead appended as one line to a single compressed
+        PROCESSED/reports/parsed_<date>.jsonl archive at the end of the batch.
+        """
+        date_folder = datetime.now().strftime("%Y-%m-%d")
+        work = self._collect_drop_off_work()
+        if not work:
+            return []
+        
+        # Files are independent: overlap parsing with copy and JSON write I/O
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._parse_and_organize, label, parse, organize, file_path,
+                                       date_folder, not archive)
+                       for label, parse, organize, file_path in work]
+            results = [future.result() for future in futures]
+        
+        processed_files = [result for result in results if result is not None]
+        if archive and processed_files:
+            self._write_batch_archive(processed_files, date_folder)
+        return processed_files
+    
+    async def aprocess_drop_off_files(self, max_workers: Optional[int] = None,
+                                      archive: bool = False) -> List[Dict[str, Any]]:
+        """Async process_drop_off_files: one executor task per file, awaited without blocking the loop"""
+        date_folder = datetime.now().strftime("%Y-%m-%d")
+        work = self._collect_drop_off_work()
+        if not work:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(executor, self._parse_and_organize, label, parse, organize, file_path,
+                                     date_folder, not archive)
+                for label, parse, organize, file_path in work))
+        
+        processed_files = [result for result in results if result is not None]
+        if archive and processed_files:
+            await loop.run_in_executor(None, self._write_batch_archive, processed_files, date_folder)
+        return processed_files
+    
+    def _collect_drop_off_work(self) -> List[Tuple[str, Any, Any, str]]:
+        """List (label, parse, organize, path) for every setup, CSV and Excel file in DROP-OFF"""
+        work = []
         
-        # Process setup files
+        # Collect setup files
         setup_files_dir = self.drop_off_dir / "setup_files"
-        for file_path in setup_files_dir.glob("*.htm"):
-            logger.info(f"Processing setup file: {file_path}")
-            setup_data = self.parse_iracing_htm(str(file_path))
-            if "error" not in setup_data:
-                organized_path = self.organize_setup_file(setup_data)
-                setup_data["organized_path"] = organized_path
-                processed_files.append(setup_data)
+        with os.scandir(setup_files_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".htm") and entry.is_file():
+                    work.append(("setup file", self.parse_iracing_htm, self.organize_setup_file, entry.path))
         
-        # Process MoTeC files
+        # Collect MoTeC CSV and Excel files in a single pass
         motec_files_dir = self.drop_off_dir / "motec_sheets"
-        for file_path in motec_files_dir.glob("*.csv"):
-            logger.info(f"Processing MoTeC CSV: {file_path}")
-            motec_data = self.parse_motec_csv(str(file_path))
-            if "error" not in motec_data:
-                organized_path = self.organize_motec_file(motec_data)
-                motec_data["organized_path"] = organized_path
-                processed_files.append(motec_data)
-        
-        # Process Excel files
-        for file_path in motec_files_dir.glob("*.xlsx"):
-            logger.info(f"Processing Excel file: {file_path}")
-            excel_data = self.parse_motec_excel(str(file_path))
-            if "error" not in excel_data:
-                organized_path = self.organize_motec_file(excel_data)
-                excel_data["organized_path"] = organized_path
-                processed_files.append(excel_data)
-        
-        return processed_files
+        with os.scandir(motec_files_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".csv"):
+                    label, parse = "MoTeC CSV", self.parse_motec_csv
+                elif entry.name.endswith(".xlsx"):
+                    label, parse = "Excel file", self.parse_motec_excel
+                else:
+                    continue
+                if entry.is_file():
+                    work.append((label, parse, self.organize_motec_file, entry.path))
+        
+        return work
+    
+    def _parse_and_organize(self, label: str, parse, organize, file_path: str,
+                            date_folder: str, write_json: bool = True) -> Optional[Dict[str, Any]]:
+        """Parse one drop-off file and organize it, returning None if parsing failed"""
+        logger.info(f"Processing {label}: {file_path}")
+        data = parse(file_path)
+        if "error" in data:
+            return None
+        data["organized_path"] = organize(data, date_folder, write_json)
+        return data
+    
+    def _write_batch_archive(self, processed_files: List[Dict[str, Any]], date_folder: str) -> Path:
+        """Append parsed results as JSON lines to the day's compressed archive in one sequential write"""
+        payload = b"".join(self.to_json(data) + b"\n" for data in processed_files)
+        reports_dir = self.processed_dir / "reports"
+        self._ensure_dir(reports_dir)
+        # Appending keeps earlier batches: zstd frames and gzip members both concatenate
+        if zstandard is not None:
+            archive_path = reports_dir / f"parsed_{date_folder}.jsonl.zst"
+            with open(archive_path, 'ab') as f:
+                f.write(zstandard.ZstdCompressor(level=3).compress(payload))
+        else:
+            archive_path = reports_dir / f"parsed_{date_folder}.jsonl.gz"
+            with open(archive_path, 'ab') as f:
+                f.write(gzip.compress(payload))
+        logger.info(f"Archived {len(processed_files)} parsed files to: {archive_path}")
+        return archive_path
     
-    def organize_setup_file(self, setup_data: Dict[str, Any]) -> str:
+    def organize_setup_file(self, setup_data: Dict[str, Any], date_folder: Optional[str] = None,
+                            write_json: bool = True) -> str:
         """Organize setup file into appropriate folder structure: by_car > date"""
         metadata = setup_data.get("metadata", {})
         car_type = metadata.get("car_type", "unknown")
@@ -726,68 +1219,71 @@ class SetupFileParser:
         track_name = track_info.get("name", "unknown").replace(" ", "_").lower()
         
         # Create organized folder structure: by_car > date
-        date_folder = pd.Timestamp.now().strftime("%Y-%m-%d")
-        car_date_folder = self.processed_dir / "by_car" / car_type / date_folder
-        car_date_folder.mkdir(parents=True, exist_ok=True)
+        now = datetime.now()
+        if date_folder is None:
+            date_folder = now.strftime("%Y-%m-%d")
+        car_date_folder = self._organized_dir("by_car", car_type, date_folder)
+        
+        # Reuse a copy organized by an earlier run, whatever its timestamp
+        source = Path(setup_data["file_path"])
+        existing = _find_organized_copy(source, car_date_folder, f"{track_name}_{source.name}")
+        if existing is not None:
+            logger.info(f"Setup file already organized: {existing}")
+            return str(existing)
         
         # Generate filename with timestamp and track info
-        original_filename = Path(setup_data["file_path"]).name
-        timestamp = pd.Timestamp.now().strftime("%H%M%S")
-        new_filename = f"{timestamp}_{track_name}_{original_filename}"
+        timestamp = now.strftime("%H%M%S")
+        new_filename = f"{timestamp}_{track_name}_{source.name}"
         
         # Copy file to organized location
-        import shutil
         organized_file_path = car_date_folder / new_filename
-        shutil.copy2(setup_data["file_path"], organized_file_path)
+        _fastcopy(source, organized_file_path)
         
         # Save parsed data as JSON
-        json_filename = new_filename.replace(".htm", "_parsed.json")
-        json_path = car_date_folder / json_filename
-        
-        with open(json_path, 'w') as f:
-            json.dump(setup_data, f, indent=2, default=str)
+        if write_json:
+            json_filename = f"{timestamp}_{track_name}_{source.stem}_parsed.json"
+            json_path = car_date_folder / json_filename
+            self._write_json(json_path, setup_data)
         
         logger.info(f"Organized setup file to: {organized_file_path}")
         return str(organized_file_path)
     
-    def organize_motec_file(self, motec_data: Dict[str, Any]) -> str:
+    def organize_motec_file(self, motec_data: Dict[str, Any], date_folder: Optional[str] = None,
+                            write_json: bool = True) -> str:
         """Organize MoTeC file into appropriate folder structure: by_car > date"""
         # Try to extract car info from filename or content
-        file_path = motec_data.get("file_path", "")
-        filename = Path(file_path).name.lower()
-        
-        # Attempt to detect car type from filename
-        car_type = "unknown"
-        if "gt3" in filename:
-            car_type = "gt3_generic"
-        elif "nascar" in filename:
-            car_type = "nascar_generic"
-        elif "tcr" in filename:
-            car_type = "tcr_generic"
-        elif "formula" in filename:
-            car_type = "formula_generic"
+        source = Path(motec_data.get("file_path", ""))
+        filename = source.name.lower()
+        
+        # Attempt to detect car type from filename; the highest-priority keyword wins
+        found = _MOTEC_CAR_TYPE_RE.findall(filename)
+        car_type = _MOTEC_CAR_TYPES[min(found, key=_MOTEC_CAR_PRIORITY.__getitem__)] if found else "unknown"
         
         # Create organized folder structure: motec_analysis > car_type > date
-        date_folder = pd.Timestamp.now().strftime("%Y-%m-%d")
-        motec_car_date_folder = self.processed_dir / "motec_analysis" / car_type / date_folder
-        motec_car_date_folder.mkdir(parents=True, exist_ok=True)
+        now = datetime.now()
+        if date_folder is None:
+            date_folder = now.strftime("%Y-%m-%d")
+        motec_car_date_folder = self._organized_dir("motec_analysis", car_type, date_folder)
+        
+        # Reuse a copy organized by an earlier run, whatever its timestamp
+        existing = _find_organized_copy(source, motec_car_date_folder, source.name)
+        if existing is not None:
+            logger.info(f"MoTeC file already organized: {existing}")
+            return str(existing)
         
         # Generate filename with timestamp
-        original_filename = Path(file_path).name
-        timestamp = pd.Timestamp.now().strftime("%H%M%S")
-        new_filename = f"{timestamp}_{original_filename}"
+        timestamp = now.strftime("%H%M%S")
+        new_filename = f"{timestamp}_{source.name}"
         
         # Copy file to organized location
-        import shutil
         organized_path = motec_car_date_folder / new_filename
-        shutil.copy2(file_path, organized_path)
+        _fastcopy(source, organized_path)
         
         # Save parsed data as JSON
-        json_filename = new_filename.replace(".csv", "_parsed.json").replace(".xlsx", "_parsed.json")
-        json_path = motec_car_date_folder / json_filename
-        
-        with open(json_path, 'w') as f:
-            json.dump(motec_data, f, indent=2, default=str)
+        if write_json:
+            json_filename = f"{timestamp}_{source.stem}_parsed.json"
+            json_path = motec_car_date_folder / json_filename
+            self._write_json(json_path, motec_data)
         
         logger.info(f"Organized MoTeC file to: {organized_path}")
         return str(organized_path)
@@ -801,17 +1297,14 @@ class SetupFileParser:
         report.append("="*80)
         report.append("SETUP COMPARISON REPORT")
         report.append("="*80)
-        report.append(f"Generated: {pd.Timestamp.now()}")
+        report.append(f"Generated: {datetime.now()}")
         report.append(f"Comparing {len(setup_files)} setup files")
         report.append("")
         
         # Group by car type
         by_car_type = {}
-        for setup in setup_files:
-            car_type = setup.get("metadata", {}).get("car_type", "unknown")
-            if car_type not in by_car_type:
-                by_car_type[car_type] = []
-            by_car_type[car_type].append(setup)
+        for view in map(_comparison_view, setup_files):
+            by_car_type.setdefault(view.car_type, []).append(view)
         
         # Compare setups within each car type
         for car_type, setups in by_car_type.items():
@@ -819,10 +1312,9 @@ class SetupFileParser:
                 report.append(f"CAR TYPE: {car_type.upper()}")
                 report.append("-" * 40)
                 
-                for i, setup in enumerate(setups):
-                    setup_name = setup.get("setup_name", f"Setup {i+1}")
-                    track_name = setup.get("track_name", "Unknown")
-                    report.append(f"  {i+1}. {setup_name} @ {track_name}")
+                for i, view in enumerate(setups):
+                    setup_name = view.setup_name if view.setup_name is not None else f"Setup {i+1}"
+                    report.append(f"  {i+1}. {setup_name} @ {view.track_name}")
                 
                 # Compare key parameters
                 report.append("\nKEY PARAMETER DIFFERENCES:")
@@ -833,17 +1325,17 @@ class SetupFileParser:
                     setup1 = setups[0]
                     setup2 = setups[1]
                     
-                    tire1 = setup1.get("parsed_data", {}).get("tires", {})
-                    tire2 = setup2.get("parsed_data", {}).get("tires", {})
+                    tire1 = setup1.tires
+                    tire2 = setup2.tires
                     
                     if tire1 and tire2:
                         report.append("TIRE PRESSURES:")
-                        for position in ["left_front", "right_front", "left_rear", "right_rear"]:
-                            pressure1 = tire1.get(f"{position}_start_pressure")
-                            pressure2 = tire2.get(f"{position}_start_pressure")
+                        for key, label in _START_PRESSURE_ROWS:
+                            pressure1 = tire1.get(key)
+                            pressure2 = tire2.get(key)
                             if pressure1 is not None and pressure2 is not None:
                                 diff = pressure2 - pressure1
-                                report.append(f"  {position.replace('_', ' ').title()}: {pressure1:.1f} vs {pressure2:.1f} psi (Δ{diff:+.1f})")
+                                report.append(f"  {label}: {pressure1:.1f} vs {pressure2:.1f} psi (Δ{diff:+.1f})")
                 
                 report.append("")
         
@@ -851,7 +1343,12 @@ class SetupFileParser:
     
     def watch_drop_off_folder(self, interval: int = 30):
         """Watch DROP-OFF folder for new files (for future automated processing)"""
-        import time
+        if watch_paths is not None:
+            self._watch_drop_off_events()
+            return
+        if INotify is not None:
+            self._watch_drop_off_inotify()
+            return
         
         logger.info(f"Watching DROP-OFF folder every {interval} seconds...")
         
@@ -859,20 +1356,11 @@ class SetupFileParser:
         
         while True:
             try:
-                current_files = {}
-                
-                # Check for new files
-                for folder in ["setup_files", "motec_sheets", "images"]:
-                    folder_path = self.drop_off_dir / folder
-                    if folder_path.exists():
-                        for file_path in folder_path.iterdir():
-                            if file_path.is_file():
-                                mod_time = file_path.stat().st_mtime
-                                current_files[str(file_path)] = mod_time
+                current_files = self._scan_drop_off_folders()
                 
                 # Process new or modified files
                 for file_path, mod_time in current_files.items():
-                    if file_path not in last_processed or last_processed[file_path] < mod_time:
+                    if last_processed.get(file_path, -1) < mod_time:
                         logger.info(f"New/modified file detected: {file_path}")
                         # Process the file here
                         last_processed[file_path] = mod_time
@@ -886,6 +1374,52 @@ class SetupFileParser:
                 logger.error(f"Error in file watcher: {e}")
                 time.sleep(interval)
     
+    def _scan_drop_off_folders(self) -> Dict[str, int]:
+        """Return {path: mtime_ns} for the files in the watched DROP-OFF folders"""
+        current_files = {}
+        for folder in WATCH_FOLDERS:
+            try:
+                with os.scandir(self.drop_off_dir / folder) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            current_files[entry.path] = entry.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return current_files
+    
+    def _watch_drop_off_events(self):
+        """Block on filesystem change events from watchfiles instead of polling"""
+        folders = [self.drop_off_dir / folder for folder in WATCH_FOLDERS]
+        logger.info("Watching DROP-OFF folder for filesystem events...")
+        try:
+            for changes in watch_paths(*folders, recursive=False):
+                for change, file_path in changes:
+                    if change != Change.deleted and os.path.isfile(file_path):
+                        logger.info(f"New/modified file detected: {file_path}")
+                        # Process the file here
+        except KeyboardInterrupt:
+            logger.info("Stopping file watcher...")
+    
+    def _watch_drop_off_inotify(self):
+        """Block on inotify close-after-write and move-in events instead of polling"""
+        logger.info("Watching DROP-OFF folder with inotify...")
+        with INotify() as inotify:
+            folders = {}
+            for folder in WATCH_FOLDERS:
+                folder_path = self.drop_off_dir / folder
+                if folder_path.is_dir():
+                    watch = inotify.add_watch(folder_path, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+                    folders[watch] = folder_path
+            try:
+                while True:
+                    for event in inotify.read():
+                        file_path = folders[event.wd] / event.name
+                        if file_path.is_file():
+                            logger.info(f"New/modified file detected: {file_path}")
+                            # Process the file here
+            except KeyboardInterrupt:
+                logger.info("Stopping file watcher...")
+    
 def main():
     """Test the enhanced setup parser with different car types"""
     parser = SetupFileParser()
@@ -901,8 +1435,8 @@ def main():
     
     processed_setups = []
     
-    for htm_file in test_files:
-        if os.path.exists(htm_file):
+    for htm_file in map(Path, test_files):
+        if htm_file.exists():
             print(f"\n{'='*60}")
             print(f"PARSING: {htm_file}")
             print('='*60)
@@ -934,14 +1468,14 @@ def main():
                     for position in ["left_front", "right_front", "left_rear", "right_rear"]:
                         pressure = tires.get(f"{position}_start_pressure")
                         if pressure is not None:
-                            print(f"  {position.replace('_', ' ').title()}: {pressure} psi")
+                            print(f"  {pretty_label(position)}: {pressure} psi")
                 
                 # Aerodynamics
                 aero = parsed_data.get("aerodynamics", {})
                 if aero:
                     print("\nAERODYNAMICS:")
                     for param, value in aero.items():
-                        print(f"  {param.replace('_', ' ').title()}: {value}")
+                        print(f"  {pretty_label(param)}: {value}")
                 
                 # Weight distribution
                 suspension = parsed_data.get("suspension", {})
@@ -949,7 +1483,7 @@ def main():
                     print("\nWEIGHT & SUSPENSION:")
                     for param in ["nose_weight_percent", "cross_weight_percent"]:
                         if param in suspension:
-                            print(f"  {param.replace('_', ' ').title()}: {suspension[param]}%")
+                            print(f"  {pretty_label(param)}: {suspension[param]}%")
             else:
                 print(f"ERROR: {setup_data['error']}")
     
@@ -967,12 +1501,11 @@ def main():
     print('='*60)
     
     # Move some files to DROP-OFF for testing
-    import shutil
     drop_off_setup_dir = parser.drop_off_dir / "setup_files"
     
-    for test_file in test_files[:2]:  # Move first 2 files
-        if os.path.exists(test_file):
-            dest_path = drop_off_setup_dir / test_file
+    for test_file in map(Path, test_files[:2]):  # Move first 2 files
+        if test_file.exists():
+            dest_path = drop_off_setup_dir / test_file.name
             if not dest_path.exists():
                 shutil.copy2(test_file, dest_path)
                 print(f"Copied {test_file} to DROP-OFF folder")
@@ -4,18 +4,71 @@ SimFlowSetupAgent - Setup Sheet Generator
 Generates human-readable setup sheets from parsed setup data
 """
 
+import io
 import os
-import json
-import pandas as pd
-from typing import Dict, Any, List, Optional
+import csv
+from typing import Dict, Any, Iterator, List, TextIO
 from pathlib import Path
 import logging
-from datetime import datetime
+import time
+
+if __package__:
+    from .profile_cache import load_profile_directory
+    from .report_common import START_PRESSURE_KEYS, pretty_label, section_title
+else:
+    from profile_cache import load_profile_directory
+    from report_common import START_PRESSURE_KEYS, pretty_label, section_title
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Separator rules shared by the table and report generators
+_EQ120 = "=" * 120
+_EQ80 = "=" * 80
+_DASH80 = "-" * 80
+_DASH60 = "-" * 60
+
+# Fixed-width table rows as bound format methods, plus the column header block
+# emitted under every section heading
+_PARAM_ROW = "{:<35} {:<12} {:<12} {:<15} {}".format
+_PARAM_TABLE_HEADER = (_DASH80, _PARAM_ROW("Parameter", "Min", "Max", "Unit", "Description"), _DASH80)
+_COMPARE_ROW = "{:<35} {:<20} {:<20} {}".format
+_COMPARE_TABLE_HEADER = (_DASH80, _COMPARE_ROW("Parameter", "Setup 1", "Setup 2", "Difference"), _DASH80)
+
+# Exact value types the comparison table subtracts; bool is kept because
+# isinstance(True, int) made booleans numeric before
+_NUMTYPES = frozenset((int, float, bool))
+
+# In-range advice by parameter name fragment, checked in order:
+# fragment -> (low position, high position, advice below low, advice above high)
+_RECOMMENDATION_RULES = {
+    "tire_pressure": (0.3, 0.7, "Consider increasing for better tire temps", "Consider decreasing for better grip"),
+    "wing_angle": (0.4, 0.6, "Low downforce setup - good for speed", "High downforce setup - good for corners"),
+    "spring_rate": (0.4, 0.6, "Soft springs - good for mechanical grip", "Stiff springs - good for aero platform"),
+}
+
+# Markdown export table header and row template
+_MD_TABLE_HEADER = "| Parameter | Value |\n|-----------|-------|\n"
+_MD_ROW = "| {} | {} |\n".format
+
+# Column order of the flattened CSV export
+_CSV_FIELDS = ('Section', 'Parameter', 'Value', 'Source_File')
+
+
+def _dict_sections(sections: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Keep only the sections that map parameter names to values"""
+    return {name: data for name, data in sections.items() if isinstance(data, dict)}
+
+
+def _index_sections(sections: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten {section: {param: value}} to {param: value}; the first section holding a param wins"""
+    index = {}
+    for section_data in _dict_sections(sections).values():
+        for param_name, value in section_data.items():
+            index.setdefault(param_name, value)
+    return index
+
 
 class SetupSheetGenerator:
     """Generate setup sheets in various formats"""
@@ -23,49 +76,60 @@ class SetupSheetGenerator:
     def __init__(self, vehicle_profiles_dir: str = "vehicle_profiles"):
         self.vehicle_profiles_dir = Path(vehicle_profiles_dir)
         self.vehicle_profiles = {}
+        self._param_table_cache = {}
+        self._param_specs = {}
         self.load_vehicle_profiles()
     
     def load_vehicle_profiles(self):
-        """Load all vehicle profile JSON files"""
+        """Load all vehicle profile JSON files, reusing the pickle cache when unchanged"""
+        # Rendered tables depend on the profiles, so drop them on every (re)load
+        self._param_table_cache.clear()
         try:
-            for profile_file in self.vehicle_profiles_dir.glob("*.json"):
-                with open(profile_file, 'r') as f:
-                    profile_data = json.load(f)
-                    category = profile_data.get("vehicle_info", {}).get("category", "unknown")
-                    self.vehicle_profiles[category] = profile_data
-                    logger.info(f"Loaded vehicle profile: {profile_file.name}")
+            load_profile_directory(self.vehicle_profiles_dir, self.vehicle_profiles)
+            self._index_parameter_specs()
         except Exception as e:
             logger.error(f"Error loading vehicle profiles: {e}")
     
+    def _index_parameter_specs(self):
+        """Map every profile's parameter names straight to their specs"""
+        self._param_specs = {
+            category: _index_sections(profile.get("setup_parameters", {}))
+            for category, profile in self.vehicle_profiles.items()
+        }
+    
     def generate_parameter_table(self, vehicle_category: str = "gt3") -> str:
-        """Generate a formatted parameter table for a vehicle category"""
-        if vehicle_category not in self.vehicle_profiles:
-            return f"Vehicle category '{vehicle_category}' not found in profiles."
-        
-        profile = self.vehicle_profiles[vehicle_category]
+        """Generate a formatted parameter table for a vehicle category, rendered once per category"""
+        table = self._param_table_cache.get(vehicle_category)
+        if table is None:
+            if vehicle_category not in self.vehicle_profiles:
+                return f"Vehicle category '{vehicle_category}' not found in profiles."
+            table = self._render_parameter_table(self.vehicle_profiles[vehicle_category])
+            self._param_table_cache[vehicle_category] = table
+        return table
+    
+    def _render_parameter_table(self, profile: Dict[str, Any]) -> str:
+        """Render the fixed-width parameter table for one vehicle profile"""
         vehicle_info = profile.get("vehicle_info", {})
         setup_params = profile.get("setup_parameters", {})
         
         table = []
-        table.append("="*120)
+        table.append(_EQ120)
         table.append(f"SETUP PARAMETERS - {vehicle_info.get('name', 'Unknown Vehicle')}")
         table.append(f"Category: {vehicle_info.get('category', 'N/A')} | Track Type: {vehicle_info.get('track_type', 'N/A')}")
         table.append(f"Series: {vehicle_info.get('series', 'N/A')}")
-        table.append("="*120)
+        table.append(_EQ120)
         table.append("")
         
-        # Generate table for each section
-        for section_name, section_params in setup_params.items():
-            table.append(f"{section_name.upper().replace('_', ' ')}:")
-            table.append("-" * 80)
-            
-            # Table header
-            table.append(f"{'Parameter':<35} {'Min':<12} {'Max':<12} {'Unit':<15} {'Description'}")
-            table.append("-" * 80)
+        # Generate table for each section that has at least one parameter spec
+        sections = [(name, params) for name, params in setup_params.items()
+                    if isinstance(params, dict) and any(isinstance(info, dict) for info in params.values())]
+        for section_name, section_params in sections:
+            table.append(f"{section_title(section_name)}:")
+            table.extend(_PARAM_TABLE_HEADER)
             
             for param_name, param_info in section_params.items():
                 if isinstance(param_info, dict):
-                    param_display = param_name.replace('_', ' ').title()
+                    param_display = pretty_label(param_name)
                     min_val = param_info.get('min', 'N/A')
                     max_val = param_info.get('max', 'N/A')
                     unit = param_info.get('unit', 'N/A')
@@ -76,7 +140,7 @@ class SetupSheetGenerator:
                         min_val = 'Options:'
                         max_val = ', '.join(param_info['options'])
                     
-                    table.append(f"{param_display:<35} {str(min_val):<12} {str(max_val):<12} {unit:<15} {description}")
+                    table.append(_PARAM_ROW(param_display, str(min_val), str(max_val), unit, description))
             
             table.append("")
         
@@ -84,65 +148,58 @@ class SetupSheetGenerator:
     
     def generate_setup_comparison_table(self, setup1: Dict[str, Any], setup2: Dict[str, Any]) -> str:
         """Generate a comparison table between two setups"""
-        table = []
-        table.append("="*120)
-        table.append("SETUP COMPARISON")
-        table.append("="*120)
+        return "\n".join(self._iter_setup_comparison(setup1, setup2))
+    
+    def stream_setup_comparison(self, setup1: Dict[str, Any], setup2: Dict[str, Any], fp: TextIO):
+        """Write the comparison table to an open text file row by row, without building it in memory"""
+        lines = self._iter_setup_comparison(setup1, setup2)
+        fp.write(next(lines))
+        fp.writelines(map("\n".__add__, lines))
+    
+    def _iter_setup_comparison(self, setup1: Dict[str, Any], setup2: Dict[str, Any]) -> Iterator[str]:
+        """Yield the comparison table one line at a time"""
+        yield _EQ120
+        yield "SETUP COMPARISON"
+        yield _EQ120
         
         # File info
         file1 = os.path.basename(setup1.get('file_path', 'Setup 1'))
         file2 = os.path.basename(setup2.get('file_path', 'Setup 2'))
         
-        table.append(f"Setup 1: {file1}")
-        table.append(f"Setup 2: {file2}")
-        table.append("")
-        
-        # Compare each section
-        parsed1 = setup1.get('parsed_data', {})
-        parsed2 = setup2.get('parsed_data', {})
+        yield f"Setup 1: {file1}"
+        yield f"Setup 2: {file2}"
+        yield ""
         
-        all_sections = set(parsed1.keys()) | set(parsed2.keys())
+        # Compare each section; non-dict sections carry no parameters and are dropped up front
+        parsed1 = _dict_sections(setup1.get('parsed_data', {}))
+        parsed2 = _dict_sections(setup2.get('parsed_data', {}))
         
-        for section in sorted(all_sections):
+        for section in sorted({**parsed1, **parsed2}):
             section_data1 = parsed1.get(section, {})
             section_data2 = parsed2.get(section, {})
             
+            # Only sections with parameters on at least one side get a table
             if section_data1 or section_data2:
-                table.append(f"{section.upper().replace('_', ' ')}:")
-                table.append("-" * 80)
-                
-                # Table header
-                table.append(f"{'Parameter':<35} {'Setup 1':<20} {'Setup 2':<20} {'Difference'}")
-                table.append("-" * 80)
+                yield f"{section_title(section)}:"
+                yield from _COMPARE_TABLE_HEADER
                 
-                all_params = set()
-                if isinstance(section_data1, dict):
-                    all_params.update(section_data1.keys())
-                if isinstance(section_data2, dict):
-                    all_params.update(section_data2.keys())
-                
-                for param in sorted(all_params):
-                    param_display = param.replace('_', ' ').title()
-                    val1 = section_data1.get(param, 'N/A') if isinstance(section_data1, dict) else 'N/A'
-                    val2 = section_data2.get(param, 'N/A') if isinstance(section_data2, dict) else 'N/A'
+                for param in sorted({**section_data1, **section_data2}):
+                    param_display = pretty_label(param)
+                    val1 = section_data1.get(param, 'N/A')
+                    val2 = section_data2.get(param, 'N/A')
                     
                     # Calculate difference if both values are numeric
-                    diff = 'N/A'
-                    try:
-                        if isinstance(val1, (int, float)) and isinstance(val2, (int, float)):
-                            diff = f"{val2 - val1:+.3f}"
-                        elif val1 == val2:
-                            diff = "Same"
-                        else:
-                            diff = "Different"
-                    except:
-                        diff = "N/A"
+                    if type(val1) in _NUMTYPES and type(val2) in _NUMTYPES:
+                        diff = f"{val2 - val1:+.3f}"
+                    elif val1 == val2:
+                        diff = "Same"
+                    else:
+                        diff = "Different"
                     
-                    table.append(f"{param_display:<35} {str(val1):<20} {str(val2):<20} {diff}")
+                    yield _COMPARE_ROW(param_display, str(val1), str(val2), diff)
                 
-                table.append("")
+                yield ""
         
-        return "\n".join(table)
     
     def generate_optimization_report(self, setup_data: Dict[str, Any], vehicle_category: str = "gt3", 
                                    session_type: str = "road_course") -> str:
@@ -151,41 +208,42 @@ class SetupSheetGenerator:
             return f"Vehicle category '{vehicle_category}' not found in profiles."
         
         profile = self.vehicle_profiles[vehicle_category]
-        setup_params = profile.get("setup_parameters", {})
+        param_specs = self._param_specs.get(vehicle_category, {})
         opt_priorities = profile.get("optimization_priorities", {}).get(session_type, {})
         
         report = []
-        report.append("="*80)
+        report.append(_EQ80)
         report.append("SETUP OPTIMIZATION REPORT")
-        report.append("="*80)
+        report.append(_EQ80)
         
         # File info
         report.append(f"Setup File: {os.path.basename(setup_data.get('file_path', 'Unknown'))}")
         report.append(f"Vehicle Category: {vehicle_category}")
         report.append(f"Session Type: {session_type}")
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
         report.append("")
         
         # Analysis by priority
         parsed_data = setup_data.get("parsed_data", {})
+        param_values = _index_sections(parsed_data)
         
         for priority_level in ["primary", "secondary", "fine_tuning"]:
             if priority_level in opt_priorities:
                 params = opt_priorities[priority_level]
-                report.append(f"{priority_level.upper().replace('_', ' ')} OPTIMIZATION PARAMETERS:")
-                report.append("-" * 60)
+                report.append(f"{section_title(priority_level)} OPTIMIZATION PARAMETERS:")
+                report.append(_DASH60)
                 
                 for param in params:
                     # Find the parameter in the setup data
-                    current_value = self._find_parameter_value(parsed_data, param)
-                    param_spec = self._find_parameter_spec(setup_params, param)
+                    current_value = param_values.get(param)
+                    param_spec = param_specs.get(param)
                     
                     if current_value is not None and param_spec:
                         recommendations = self._generate_parameter_recommendations(
                             param, current_value, param_spec
                         )
                         
-                        report.append(f"  {param.replace('_', ' ').title()}:")
+                        report.append(f"  {pretty_label(param)}:")
                         report.append(f"    Current: {current_value} {param_spec.get('unit', '')}")
                         report.append(f"    Range: {param_spec.get('min', 'N/A')} - {param_spec.get('max', 'N/A')} {param_spec.get('unit', '')}")
                         
@@ -200,28 +258,13 @@ class SetupSheetGenerator:
         balance_analysis = self._analyze_balance(parsed_data)
         if balance_analysis:
             report.append("BALANCE ANALYSIS:")
-            report.append("-" * 60)
+            report.append(_DASH60)
             for analysis in balance_analysis:
                 report.append(f"  {analysis}")
             report.append("")
         
         return "\n".join(report)
     
-    def _find_parameter_value(self, parsed_data: Dict[str, Any], param_name: str) -> Optional[Any]:
-        """Find a parameter value in parsed setup data"""
-        # Search through all sections for the parameter
-        for section_data in parsed_data.values():
-            if isinstance(section_data, dict) and param_name in section_data:
-                return section_data[param_name]
-        return None
-    
-    def _find_parameter_spec(self, setup_params: Dict[str, Any], param_name: str) -> Optional[Dict[str, Any]]:
-        """Find parameter specification in vehicle profile"""
-        for section_data in setup_params.values():
-            if isinstance(section_data, dict) and param_name in section_data:
-                return section_data[param_name]
-        return None
-    
     def _generate_parameter_recommendations(self, param_name: str, current_value: Any, 
                                          param_spec: Dict[str, Any]) -> str:
         """Generate recommendations for a specific parameter"""
@@ -242,23 +285,13 @@ class SetupSheetGenerator:
                     # Value is in range, provide context-specific advice
                     range_position = (curr_val - min_val) / (max_val - min_val)
                     
-                    if 'tire_pressure' in param_name:
-                        if range_position < 0.3:
-                            recommendations.append("Consider increasing for better tire temps")
-                        elif range_position > 0.7:
-                            recommendations.append("Consider decreasing for better grip")
-                    
-                    elif 'wing_angle' in param_name:
-                        if range_position < 0.4:
-                            recommendations.append("Low downforce setup - good for speed")
-                        elif range_position > 0.6:
-                            recommendations.append("High downforce setup - good for corners")
-                    
-                    elif 'spring_rate' in param_name:
-                        if range_position < 0.4:
-                            recommendations.append("Soft springs - good for mechanical grip")
-                        elif range_position > 0.6:
-                            recommendations.append("Stiff springs - good for aero platform")
+                    rule = next((rule for tag, rule in _RECOMMENDATION_RULES.items() if tag in param_name), None)
+                    if rule:
+                        low, high, low_advice, high_advice = rule
+                        if range_position < low:
+                            recommendations.append(low_advice)
+                        elif range_position > high:
+                            recommendations.append(high_advice)
                     
                     if not recommendations:
                         recommendations.append("Value within optimal range")
@@ -275,17 +308,14 @@ class SetupSheetGenerator:
         # Analyze tire pressure balance
         tire_data = parsed_data.get('tires', {})
         if tire_data:
-            pressures = []
-            for pos in ['left_front', 'right_front', 'left_rear', 'right_rear']:
-                key = f"{pos}_start_pressure"
-                if key in tire_data:
-                    pressures.append(tire_data[key])
+            pressures = [tire_data[key] for key in START_PRESSURE_KEYS if key in tire_data]
             
             if len(pressures) == 4:
-                front_avg = (pressures[0] + pressures[1]) / 2
-                rear_avg = (pressures[2] + pressures[3]) / 2
-                left_avg = (pressures[0] + pressures[2]) / 2
-                right_avg = (pressures[1] + pressures[3]) / 2
+                left_front, right_front, left_rear, right_rear = pressures
+                front_avg = (left_front + right_front) / 2
+                rear_avg = (left_rear + right_rear) / 2
+                left_avg = (left_front + left_rear) / 2
+                right_avg = (right_front + right_rear) / 2
                 
                 if abs(front_avg - rear_avg) > 1.0:
                     analysis.append(f"Tire pressure F/R imbalance: {front_avg:.1f} vs {rear_avg:.1f} psi")
@@ -316,76 +346,76 @@ class SetupSheetGenerator:
         
         return analysis
     
+    def render_csv(self, setup_data: Dict[str, Any]) -> str:
+        """Render setup data as CSV text, one row per parameter"""
+        buffer = io.StringIO()
+        self._write_csv_rows(setup_data, buffer)
+        return buffer.getvalue()
+    
+    def _write_csv_rows(self, setup_data: Dict[str, Any], f: TextIO):
+        """Write the CSV header and one row per parameter to an open text file"""
+        parsed_data = _dict_sections(setup_data.get('parsed_data', {}))
+        source_file = os.path.basename(setup_data.get('file_path', 'Unknown'))
+        
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(_CSV_FIELDS)
+        for section_name, section_data in parsed_data.items():
+            for param_name, param_value in section_data.items():
+                writer.writerow((section_name, param_name, param_value, source_file))
+    
     def export_to_csv(self, setup_data: Dict[str, Any], output_file: str):
         """Export setup data to CSV format"""
         try:
-            rows = []
-            
-            # Flatten setup data for CSV export
-            parsed_data = setup_data.get('parsed_data', {})
-            
-            for section_name, section_data in parsed_data.items():
-                if isinstance(section_data, dict):
-                    for param_name, param_value in section_data.items():
-                        rows.append({
-                            'Section': section_name,
-                            'Parameter': param_name,
-                            'Value': param_value,
-                            'Source_File': os.path.basename(setup_data.get('file_path', 'Unknown'))
-                        })
-            
-            # Create DataFrame and export
-            df = pd.DataFrame(rows)
-            df.to_csv(output_file, index=False)
+            # Flatten setup data and stream one row per parameter
+            with open(output_file, 'w', newline='') as f:
+                self._write_csv_rows(setup_data, f)
             
             logger.info(f"Setup data exported to {output_file}")
             
         except Exception as e:
             logger.error(f"Error exporting to CSV: {e}")
     
+    def render_markdown(self, setup_data: Dict[str, Any]) -> str:
+        """Render setup data as a Markdown report"""
+        parts = ["# Setup Analysis Report\n\n"]
+        
+        # File info
+        parts.append(f"**File:** {os.path.basename(setup_data.get('file_path', 'Unknown'))}\n")
+        parts.append(f"**Type:** {setup_data.get('file_type', 'Unknown')}\n")
+        parts.append(f"**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        
+        if 'car_name' in setup_data:
+            parts.append(f"**Car:** {setup_data['car_name']}\n")
+        if 'track_name' in setup_data:
+            parts.append(f"**Track:** {setup_data['track_name']}\n")
+        if 'setup_name' in setup_data:
+            parts.append(f"**Setup:** {setup_data['setup_name']}\n")
+        
+        parts.append("\n")
+        
+        # Parse each section
+        parsed_data = _dict_sections(setup_data.get("parsed_data", {}))
+        
+        for section_name, section_data in parsed_data.items():
+            if section_data:
+                parts.append(f"## {pretty_label(section_name)}\n\n")
+                parts.append(_MD_TABLE_HEADER)
+                parts.extend(_MD_ROW(pretty_label(param), value)
+                             for param, value in section_data.items())
+                parts.append("\n")
+        
+        return "".join(parts)
+    
     def export_to_markdown(self, setup_data: Dict[str, Any], output_file: str):
         """Export setup data to Markdown format"""
         try:
-            with open(output_file, 'w') as f:
-                f.write("# Setup Analysis Report\n\n")
-                
-                # File info
-                f.write(f"**File:** {os.path.basename(setup_data.get('file_path', 'Unknown'))}\n")
-                f.write(f"**Type:** {setup_data.get('file_type', 'Unknown')}\n")
-                f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                if 'car_name' in setup_data:
-                    f.write(f"**Car:** {setup_data['car_name']}\n")
-                if 'track_name' in setup_data:
-                    f.write(f"**Track:** {setup_data['track_name']}\n")
-                if 'setup_name' in setup_data:
-                    f.write(f"**Setup:** {setup_data['setup_name']}\n")
-                
-                f.write("\n")
-                
-                # Parse each section
-                parsed_data = setup_data.get("parsed_data", {})
-                
-                for section_name, section_data in parsed_data.items():
-                    if section_data:
-                        f.write(f"## {section_name.replace('_', ' ').title()}\n\n")
-                        
-                        if isinstance(section_data, dict):
-                            f.write("| Parameter | Value |\n")
-                            f.write("|-----------|-------|\n")
-                            
-                            for param, value in section_data.items():
-                                param_display = param.replace('_', ' ').title()
-                                f.write(f"| {param_display} | {value} |\n")
-                        
-                        f.write("\n")
+            Path(output_file).write_bytes(self.render_markdown(setup_data).encode("utf-8"))
             
             logger.info(f"Setup data exported to {output_file}")
             
         except Exception as e:
             logger.error(f"Error exporting to Markdown: {e}")
 
-
 def main():
     """Test the setup sheet generator"""
     generator = SetupSheetGenerator()
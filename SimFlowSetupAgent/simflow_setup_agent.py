@@ -5,18 +5,23 @@ Expert iRacing setup engineer agent with data-driven optimization
 """
 
 import os
+import copy
 import sys
-import json
 import argparse
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
-# Add the scripts directory to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'scripts'))
-
-from setup_file_parser import SetupFileParser
-from setup_sheet_generator import SetupSheetGenerator
+# Only the small shared report module is imported up front; the parser and generator load in __init__
+if __package__:
+    from .scripts.report_common import START_PRESSURE_KEYS, pretty_label, section_title
+else:
+    from scripts.report_common import START_PRESSURE_KEYS, pretty_label, section_title
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +30,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parsed setup files kept in memory per agent, keyed by path, mtime and size
+PARSE_CACHE_SIZE = 64
+
+# Separator rules used by the text report
+_EQ80 = "=" * 80
+_DASH40 = "-" * 40
+
+# Parsed spring rate keys per axle for the suspension balance analysis
+_FRONT_SPRING_KEYS = ('left_front_spring_rate', 'right_front_spring_rate')
+_REAR_SPRING_KEYS = ('left_rear_spring_rate', 'right_rear_spring_rate')
+
+# Session and aggression descriptions, shared read-only by every agent
+_SESSION_TYPES = MappingProxyType({
+    "sprint": "Sprint race setup (25-30 minutes, 50% fuel)",
+    "endurance": "Endurance race setup (60+ minutes, 100% fuel)",
+    "road_course": "General road course setup",
+    "qualifying": "Qualifying setup (maximum performance)",
+    "practice": "Practice setup (balanced for learning)"
+})
+
+_AGGRESSION_LEVELS = MappingProxyType({
+    "conservative": "Safe, stable setup with margin for error",
+    "balanced": "Balanced setup with moderate risk/reward",
+    "aggressive": "High-performance setup with tight margins",
+    "experimental": "Experimental setup for testing limits"
+})
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """float(value), or None when the value is not numeric"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _numeric_range(spec: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """A spec's (min, max) as floats, or None when either bound is missing or not numeric"""
+    try:
+        return float(spec['min']), float(spec['max'])
+    except (KeyError, ValueError, TypeError):
+        return None
+
 
 class SimFlowSetupAgent:
     """
@@ -38,30 +86,53 @@ class SimFlowSetupAgent:
     - Export results in multiple formats
     """
     
+    __slots__ = (
+        'workspace_dir', 'vehicle_profiles_dir', 'output_dir', 'parser', 'generator',
+        '_parsers', '_parse_cache', '_parse_lock', '_flat_spec_cache', '_telemetry_cache',
+        'session_types', 'aggression_levels',
+    )
+    
     def __init__(self, workspace_dir: str = None):
         self.workspace_dir = Path(workspace_dir) if workspace_dir else Path(__file__).parent
         self.vehicle_profiles_dir = self.workspace_dir / "vehicle_profiles"
         self.output_dir = self.workspace_dir / "output"
         self.output_dir.mkdir(exist_ok=True)
         
-        # Initialize parsers
+        # Initialize parsers; their modules are imported here so that `--help` and
+        # argument errors in main() return without loading them
+        if __package__:
+            from .scripts.setup_file_parser import SetupFileParser
+            from .scripts.setup_sheet_generator import SetupSheetGenerator
+        else:
+            # Run directly as a script: the agent directory is sys.path[0]
+            from scripts.setup_file_parser import SetupFileParser
+            from scripts.setup_sheet_generator import SetupSheetGenerator
+        
         self.parser = SetupFileParser(str(self.vehicle_profiles_dir))
         self.generator = SetupSheetGenerator(str(self.vehicle_profiles_dir))
         
-        self.session_types = {
-            "sprint": "Sprint race setup (25-30 minutes, 50% fuel)",
-            "endurance": "Endurance race setup (60+ minutes, 100% fuel)",
-            "road_course": "General road course setup",
-            "qualifying": "Qualifying setup (maximum performance)",
-            "practice": "Practice setup (balanced for learning)"
+        # Parser per file extension; results are reused until the file changes on disk
+        self._parsers = {
+            '.htm': self.parser.parse_iracing_htm,
+            '.csv': self.parser.parse_motec_csv,
+            '.xlsx': self.parser.parse_motec_excel,
+            '.xlsm': self.parser.parse_motec_excel,
         }
         
-        self.aggression_levels = {
-            "conservative": "Safe, stable setup with margin for error",
-            "balanced": "Balanced setup with moderate risk/reward",
-            "aggressive": "High-performance setup with tight margins",
-            "experimental": "Experimental setup for testing limits"
-        }
+        # (path as given, absolute path) -> ((mtime_ns, size), setup_data), least recently used first;
+        # the lock keeps compare_setups' parallel parses from racing on it
+        self._parse_cache = OrderedDict()
+        self._parse_lock = threading.Lock()
+        
+        # Per vehicle category: (profile, {param_name: spec}, {param_name: (min, max)}) so
+        # lookups skip the section scan and range checks skip re-parsing the bounds
+        self._flat_spec_cache = {}
+        
+        # Per vehicle category: (profile, channel tuple) for the recommended telemetry channels
+        self._telemetry_cache = {}
+        
+        self.session_types = _SESSION_TYPES
+        self.aggression_levels = _AGGRESSION_LEVELS
         
         logger.info("SimFlowSetupAgent initialized")
     
@@ -70,17 +141,7 @@ class SimFlowSetupAgent:
         """Analyze a setup file and generate recommendations"""
         logger.info(f"Analyzing setup file: {file_path}")
         
-        # Determine file type and parse accordingly
-        file_ext = Path(file_path).suffix.lower()
-        
-        if file_ext == '.htm':
-            setup_data = self.parser.parse_iracing_htm(file_path)
-        elif file_ext == '.csv':
-            setup_data = self.parser.parse_motec_csv(file_path)
-        elif file_ext in ['.xlsx', '.xlsm']:
-            setup_data = self.parser.parse_motec_excel(file_path)
-        else:
-            raise ValueError(f"Unsupported file type: {file_ext}")
+        setup_data = self._parse_setup_file(file_path)
         
         if "error" in setup_data:
             logger.error(f"Error parsing file: {setup_data['error']}")
@@ -102,22 +163,51 @@ class SimFlowSetupAgent:
         logger.info("Setup analysis completed")
         return analysis
     
-    def compare_setups(self, file1: str, file2: str, vehicle_category: str = "gt3") -> Dict[str, Any]:
-        """Compare two setup files"""
+    def compare_setups(self, file1: str, file2: str, vehicle_category: str = "gt3",
+                       max_workers: int = 2) -> Dict[str, Any]:
+        """Compare two setup files, parsing them concurrently unless max_workers is 1"""
         logger.info(f"Comparing setups: {file1} vs {file2}")
         
-        # Parse both files
-        setup1 = self.analyze_setup_file(file1, vehicle_category)
-        setup2 = self.analyze_setup_file(file2, vehicle_category)
-        
-        if "error" in setup1 or "error" in setup2:
-            return {"error": "Failed to parse one or both setup files"}
-        
-        # Generate comparison
-        comparison = self.parser.compare_setups(
-            setup1["setup_data"], 
-            setup2["setup_data"]
-        )
+        # Parse both files, parsing a file compared against itself only once; the comparison
+        # works on the parsed data alone, so the per-file analysis passes are skipped
+        parse_failed = {"error": "Failed to parse one or both setup files"}
+        
+        if file2 == file1:
+            setup1, error = self._parse_and_validate(file1)
+            if error:
+                return parse_failed
+            setup2 = setup1
+        elif max_workers > 1:
+            # Reject unsupported files before starting either parse
+            for file_path in (file1, file2):
+                self._check_file_type(file_path)
+            
+            # Stop at the first failed parse instead of waiting for the other file
+            setups = {}
+            executor = ThreadPoolExecutor(max_workers=2)
+            try:
+                futures = {executor.submit(self._parse_and_validate, file1): 1,
+                           executor.submit(self._parse_and_validate, file2): 2}
+                for future in as_completed(futures):
+                    setup, error = future.result()
+                    if error:
+                        return parse_failed
+                    setups[futures[future]] = setup
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            setup1, setup2 = setups[1], setups[2]
+        else:
+            setup1, error = self._parse_and_validate(file1)
+            if error:
+                return parse_failed
+            setup2, error = self._parse_and_validate(file2)
+            if error:
+                return parse_failed
+        
+        # Generate comparison; the parsed setups go along for the comparison report
+        comparison = self.parser.compare_setups(setup1, setup2)
+        comparison["setup1_data"] = setup1
+        comparison["setup2_data"] = setup2
         
         # Add detailed analysis
         comparison["detailed_analysis"] = self._generate_detailed_comparison(
@@ -127,6 +217,51 @@ class SimFlowSetupAgent:
         logger.info("Setup comparison completed")
         return comparison
     
+    def _check_file_type(self, file_path: str) -> str:
+        """Return the lower-cased extension of a supported setup file, raising ValueError otherwise"""
+        file_ext = Path(file_path).suffix.lower()
+        if file_ext not in self._parsers:
+            raise ValueError(f"Unsupported file type: {file_ext}")
+        return file_ext
+    
+    def _parse_and_validate(self, file_path: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Parse a setup file, returning (setup_data, error) where error is None on success"""
+        setup_data = self._parse_setup_file(file_path)
+        if "error" in setup_data:
+            return setup_data, setup_data["error"] or "Unknown parse error"
+        return setup_data, None
+    
+    def _parse_setup_file(self, file_path: str) -> Dict[str, Any]:
+        """Parse a setup file with the parser for its extension, reusing the parse while the file is unchanged; returns a copy the caller may modify"""
+        file_ext = self._check_file_type(file_path)
+        
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            # Let the parser report the missing or unreadable file
+            return self._parsers[file_ext](file_path)
+        
+        # The path as given ends up in the result, so it is part of the key next to the absolute path
+        key = (file_path, os.path.abspath(file_path))
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._parse_lock:
+            cached = self._parse_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                self._parse_cache.move_to_end(key)
+                return copy.deepcopy(cached[1])
+        
+        setup_data = self._parsers[file_ext](file_path)
+        # Failures are not cached: they can clear without the file changing, e.g. after a permissions fix
+        if "error" in setup_data:
+            return setup_data
+        
+        with self._parse_lock:
+            self._parse_cache[key] = (signature, setup_data)
+            self._parse_cache.move_to_end(key)
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return copy.deepcopy(setup_data)
+    
     def generate_setup_recommendations(self, track_name: str, session_type: str = "road_course",
                                      vehicle_category: str = "gt3", 
                                      aggression_level: str = "balanced") -> Dict[str, Any]:
@@ -173,8 +308,8 @@ class SimFlowSetupAgent:
         if vehicle_category not in self.parser.vehicle_profiles:
             return {"error": f"Vehicle category '{vehicle_category}' not found"}
         
-        profile = self.parser.vehicle_profiles[vehicle_category]
-        setup_params = profile.get("setup_parameters", {})
+        flat_specs = self._get_flat_specs(vehicle_category)
+        spec_ranges = self._get_spec_ranges(vehicle_category)
         parsed_data = setup_data.get("parsed_data", {})
         
         for section_name, section_data in parsed_data.items():
@@ -183,11 +318,11 @@ class SimFlowSetupAgent:
                 
                 for param_name, param_value in section_data.items():
                     # Find parameter spec in profile
-                    param_spec = self._find_parameter_spec(setup_params, param_name)
+                    param_spec = flat_specs.get(param_name)
                     
                     if param_spec:
                         param_analysis = self._analyze_single_parameter(
-                            param_name, param_value, param_spec
+                            param_name, param_value, param_spec, spec_ranges.get(param_name)
                         )
                         section_analysis[param_name] = param_analysis
                 
@@ -267,10 +402,14 @@ class SimFlowSetupAgent:
     
     def _get_telemetry_channels(self, vehicle_category: str) -> List[str]:
         """Get recommended telemetry channels for vehicle category"""
-        if vehicle_category not in self.parser.vehicle_profiles:
+        profile = self.parser.vehicle_profiles.get(vehicle_category)
+        if profile is None:
             return []
         
-        profile = self.parser.vehicle_profiles[vehicle_category]
+        cached = self._telemetry_cache.get(vehicle_category)
+        if cached is not None and cached[0] is profile:
+            return list(cached[1])
+        
         telemetry = profile.get("telemetry_channels", {})
         
         channels = []
@@ -278,52 +417,48 @@ class SimFlowSetupAgent:
             if level in telemetry:
                 channels.extend(telemetry[level])
         
+        self._telemetry_cache[vehicle_category] = (profile, tuple(channels))
         return channels
     
     def export_analysis(self, analysis: Dict[str, Any], output_format: str = "all") -> List[str]:
         """Export analysis results in specified format(s)"""
-        exported_files = []
-        
         setup_data = analysis.get("setup_data", {})
         file_name = Path(setup_data.get("file_path", "analysis")).stem
         
+        # Render every requested format first, then write each payload in one call
+        outputs = []
+        
         if output_format in ["all", "txt"]:
             # Export as text report
             txt_file = self.output_dir / f"{file_name}_analysis.txt"
-            with open(txt_file, 'w') as f:
-                f.write(self._generate_text_report(analysis))
-            exported_files.append(str(txt_file))
+            outputs.append((txt_file, self._generate_text_report(analysis).encode("utf-8")))
         
         if output_format in ["all", "csv"]:
             # Export as CSV
             csv_file = self.output_dir / f"{file_name}_data.csv"
-            self.generator.export_to_csv(setup_data, str(csv_file))
-            exported_files.append(str(csv_file))
+            outputs.append((csv_file, self.generator.render_csv(setup_data).encode("utf-8")))
         
         if output_format in ["all", "markdown"]:
             # Export as Markdown
             md_file = self.output_dir / f"{file_name}_analysis.md"
-            self.generator.export_to_markdown(setup_data, str(md_file))
-            exported_files.append(str(md_file))
+            outputs.append((md_file, self.generator.render_markdown(setup_data).encode("utf-8")))
         
         if output_format in ["all", "json"]:
-            # Export as JSON
+            # Export as JSON (orjson-backed when installed)
             json_file = self.output_dir / f"{file_name}_analysis.json"
-            with open(json_file, 'w') as f:
-                json.dump(analysis, f, indent=2)
-            exported_files.append(str(json_file))
+            outputs.append((json_file, self.parser.to_json(analysis, indent=True)))
+        
+        exported_files = []
+        for output_file, payload in outputs:
+            output_file.write_bytes(payload)
+            exported_files.append(str(output_file))
         
         return exported_files
     
     def _generate_text_report(self, analysis: Dict[str, Any]) -> str:
         """Generate comprehensive text report"""
-        report = []
-        
         # Header
-        report.append("=" * 80)
-        report.append("SIMFLOW SETUP AGENT - ANALYSIS REPORT")
-        report.append("=" * 80)
-        report.append("")
+        report = [_EQ80, "SIMFLOW SETUP AGENT - ANALYSIS REPORT", _EQ80, ""]
         
         # Setup info
         setup_data = analysis.get("setup_data", {})
@@ -336,11 +471,11 @@ class SimFlowSetupAgent:
         param_analysis = analysis.get("parameter_analysis", {})
         if param_analysis:
             report.append("PARAMETER ANALYSIS:")
-            report.append("-" * 40)
+            report.append(_DASH40)
             for section, params in param_analysis.items():
-                report.append(f"\n{section.upper().replace('_', ' ')}:")
+                report.append(f"\n{section_title(section)}:")
                 for param, analysis_data in params.items():
-                    report.append(f"  {param.replace('_', ' ').title()}: {analysis_data.get('status', 'Unknown')}")
+                    report.append(f"  {pretty_label(param)}: {analysis_data.get('status', 'Unknown')}")
                     if 'recommendation' in analysis_data:
                         report.append(f"    → {analysis_data['recommendation']}")
             report.append("")
@@ -349,37 +484,63 @@ class SimFlowSetupAgent:
         balance_analysis = analysis.get("balance_analysis", {})
         if balance_analysis:
             report.append("BALANCE ANALYSIS:")
-            report.append("-" * 40)
-            for assessment in balance_analysis.get("overall_assessment", []):
-                report.append(f"• {assessment}")
+            report.append(_DASH40)
+            report.extend(f"• {assessment}" for assessment in balance_analysis.get("overall_assessment", []))
             report.append("")
         
         # Optimization recommendations
         opt_recs = analysis.get("optimization_recommendations", {})
         if opt_recs:
             report.append("OPTIMIZATION RECOMMENDATIONS:")
-            report.append("-" * 40)
+            report.append(_DASH40)
             
             for category, recs in opt_recs.items():
                 if recs:
-                    report.append(f"\n{category.replace('_', ' ').title()}:")
-                    for rec in recs:
-                        report.append(f"• {rec}")
+                    report.append(f"\n{pretty_label(category)}:")
+                    report.extend(f"• {rec}" for rec in recs)
             report.append("")
         
         # Telemetry channels
         telemetry = analysis.get("telemetry_channels", [])
         if telemetry:
             report.append("RECOMMENDED TELEMETRY CHANNELS:")
-            report.append("-" * 40)
-            for i, channel in enumerate(telemetry[:15]):  # Show first 15
-                report.append(f"• {channel}")
+            report.append(_DASH40)
+            report.extend(f"• {channel}" for channel in islice(telemetry, 15))  # Show first 15
             if len(telemetry) > 15:
                 report.append(f"... and {len(telemetry) - 15} more channels")
             report.append("")
         
         return "\n".join(report)
     
+    def _get_flat_specs(self, vehicle_category: str) -> Dict[str, Any]:
+        """Return {param_name: spec} for a vehicle category, flattened once per loaded profile"""
+        profile = self.parser.vehicle_profiles.get(vehicle_category, {})
+        cached = self._flat_spec_cache.get(vehicle_category)
+        # A reloaded profile is a new object, which invalidates the entry
+        if cached is not None and cached[0] is profile:
+            return cached[1]
+        
+        flat_specs = {}
+        for section_data in profile.get("setup_parameters", {}).values():
+            if isinstance(section_data, dict):
+                for param_name, spec in section_data.items():
+                    # Same precedence as _find_parameter_spec: the first section wins
+                    if param_name in flat_specs:
+                        logger.warning(f"Parameter '{param_name}' appears in several sections of the {vehicle_category} profile")
+                        continue
+                    # Parsed keys are interned, so interned spec keys match by identity
+                    flat_specs[sys.intern(param_name)] = spec
+        
+        spec_ranges = {param_name: _numeric_range(spec) for param_name, spec in flat_specs.items()
+                       if isinstance(spec, dict)}
+        self._flat_spec_cache[vehicle_category] = (profile, flat_specs, spec_ranges)
+        return flat_specs
+    
+    def _get_spec_ranges(self, vehicle_category: str) -> Dict[str, Optional[Tuple[float, float]]]:
+        """Return {param_name: (min, max)} with float bounds, built alongside the flat specs"""
+        self._get_flat_specs(vehicle_category)
+        return self._flat_spec_cache[vehicle_category][2]
+    
     # Placeholder methods for complex analysis functions
     def _find_parameter_spec(self, setup_params: Dict[str, Any], param_name: str) -> Optional[Dict[str, Any]]:
         """Find parameter specification in setup parameters"""
@@ -389,17 +550,23 @@ class SimFlowSetupAgent:
         return None
     
     def _analyze_single_parameter(self, param_name: str, param_value: Any, 
-                                param_spec: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze a single parameter against its specification"""
+                                param_spec: Dict[str, Any],
+                                value_range: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+        """Analyze a single parameter against its specification; value_range is the precomputed float (min, max)"""
         analysis = {"value": param_value, "spec": param_spec}
         
         # Check if value is within range
         if 'min' in param_spec and 'max' in param_spec:
-            try:
-                min_val = float(param_spec['min'])
-                max_val = float(param_spec['max'])
-                curr_val = float(param_value)
-                
+            if value_range is None:
+                value_range = _numeric_range(param_spec)
+            # Parsed values are nearly always floats already, so only other types get converted
+            curr_val = param_value if type(param_value) is float else _to_float(param_value)
+            
+            if value_range is None or curr_val is None:
+                analysis["status"] = "Cannot analyze"
+                analysis["recommendation"] = "Check value format"
+            else:
+                min_val, max_val = value_range
                 if curr_val < min_val:
                     analysis["status"] = "Below minimum"
                     analysis["recommendation"] = f"Increase to at least {min_val}"
@@ -409,9 +576,6 @@ class SimFlowSetupAgent:
                 else:
                     analysis["status"] = "Within range"
                     analysis["recommendation"] = "Value is acceptable"
-            except (ValueError, TypeError):
-                analysis["status"] = "Cannot analyze"
-                analysis["recommendation"] = "Check value format"
         else:
             analysis["status"] = "No range specified"
             analysis["recommendation"] = "No specific recommendations"
@@ -423,17 +587,14 @@ class SimFlowSetupAgent:
         analysis = {"front_rear_diff": 0, "left_right_diff": 0, "recommendations": []}
         
         # Get tire pressures
-        pressures = {}
-        for pos in ['left_front', 'right_front', 'left_rear', 'right_rear']:
-            key = f"{pos}_start_pressure"
-            if key in tire_data:
-                pressures[pos] = tire_data[key]
+        pressures = [tire_data[key] for key in START_PRESSURE_KEYS if key in tire_data]
         
         if len(pressures) == 4:
-            front_avg = (pressures['left_front'] + pressures['right_front']) / 2
-            rear_avg = (pressures['left_rear'] + pressures['right_rear']) / 2
-            left_avg = (pressures['left_front'] + pressures['left_rear']) / 2
-            right_avg = (pressures['right_front'] + pressures['right_rear']) / 2
+            left_front, right_front, left_rear, right_rear = pressures
+            front_avg = (left_front + right_front) / 2
+            rear_avg = (left_rear + right_rear) / 2
+            left_avg = (left_front + left_rear) / 2
+            right_avg = (right_front + right_rear) / 2
             
             analysis["front_rear_diff"] = front_avg - rear_avg
             analysis["left_right_diff"] = left_avg - right_avg
@@ -471,20 +632,13 @@ class SimFlowSetupAgent:
         analysis = {"recommendations": []}
         
         # Analyze spring rates
-        front_springs = []
-        rear_springs = []
+        front_springs = [suspension_data[key] for key in _FRONT_SPRING_KEYS if key in suspension_data]
+        if not front_springs:
+            return analysis
         
-        for pos in ['left_front', 'right_front']:
-            key = f"{pos}_spring_rate"
-            if key in suspension_data:
-                front_springs.append(suspension_data[key])
+        rear_springs = [suspension_data[key] for key in _REAR_SPRING_KEYS if key in suspension_data]
         
-        for pos in ['left_rear', 'right_rear']:
-            key = f"{pos}_spring_rate"
-            if key in suspension_data:
-                rear_springs.append(suspension_data[key])
-        
-        if front_springs and rear_springs:
+        if rear_springs:
             front_avg = sum(front_springs) / len(front_springs)
             rear_avg = sum(rear_springs) / len(rear_springs)
             
@@ -601,8 +755,9 @@ class SimFlowSetupAgent:
         info = track_data.get(category)
         adjustments = {}
         if info and isinstance(info, dict):
+            flat_specs = self._get_flat_specs(vehicle_category)
             for param in info.get("priority_adjustments", []):
-                spec = self._find_parameter_spec(profile.get("setup_parameters", {}), param)
+                spec = flat_specs.get(param)
                 if spec:
                     if "typical_range" in spec:
                         adjustments[param] = sum(spec["typical_range"]) / 2
@@ -669,9 +824,9 @@ class SimFlowSetupAgent:
     def _generate_detailed_comparison(self, setup1: Dict[str, Any],
                                     setup2: Dict[str, Any],
                                     vehicle_category: str) -> Dict[str, Any]:
-        """Generate detailed comparison between two setups"""
-        parsed1 = setup1.get("setup_data", {}).get("parsed_data", {})
-        parsed2 = setup2.get("setup_data", {}).get("parsed_data", {})
+        """Generate detailed comparison between two parsed setups"""
+        parsed1 = setup1.get("parsed_data", {})
+        parsed2 = setup2.get("parsed_data", {})
 
         differences = []
         all_sections = set(parsed1.keys()) | set(parsed2.keys())
@@ -704,10 +859,96 @@ class SimFlowSetupAgent:
         return {"differences": differences, "summary": summary}
 
 
+def _do_analyze(args, agent: SimFlowSetupAgent):
+    """Analyze a setup file and export the results"""
+    if not args.file:
+        print("Error: --file is required for analyze command")
+        return
+    
+    print(f"Analyzing setup file: {args.file}")
+    analysis = agent.analyze_setup_file(args.file, args.vehicle, args.session)
+    
+    if "error" in analysis:
+        print(f"Error: {analysis['error']}")
+        return
+    
+    # Export results
+    exported_files = agent.export_analysis(analysis, args.output)
+    print(f"Analysis completed. Results exported to:")
+    for file in exported_files:
+        print(f"  {file}")
+
+def _do_compare(args, agent: SimFlowSetupAgent):
+    """Compare two setup files and save the comparison report"""
+    if not args.file1 or not args.file2:
+        print("Error: --file1 and --file2 are required for compare command")
+        return
+    
+    print(f"Comparing setups: {args.file1} vs {args.file2}")
+    comparison = agent.compare_setups(args.file1, args.file2, args.vehicle)
+    
+    if "error" in comparison:
+        print(f"Error: {comparison['error']}")
+        return
+    
+    # Generate and save comparison report, opening the file only once both setups are in hand
+    setup1, setup2 = comparison["setup1_data"], comparison["setup2_data"]
+    output_file = agent.output_dir / "setup_comparison.txt"
+    with open(output_file, 'w', buffering=1 << 16) as f:
+        agent.generator.stream_setup_comparison(setup1, setup2, f)
+    
+    print(f"Comparison completed. Report saved to: {output_file}")
+
+def _do_recommend(args, agent: SimFlowSetupAgent):
+    """Generate and save setup recommendations for a track"""
+    if not args.track:
+        print("Error: --track is required for recommend command")
+        return
+    
+    print(f"Generating setup recommendations for {args.track}")
+    recommendations = agent.generate_setup_recommendations(
+        args.track, args.session, args.vehicle, args.aggression
+    )
+    
+    if "error" in recommendations:
+        print(f"Error: {recommendations['error']}")
+        return
+    
+    # Save recommendations
+    output_file = agent.output_dir / f"{args.track}_recommendations.json"
+    output_file.write_bytes(agent.parser.to_json(recommendations, indent=True))
+
+    print(f"Recommendations generated and saved to: {output_file}")
+    final = recommendations.get("final_recommendations", {})
+    if final:
+        print("\nKey Adjustments:")
+        for k, v in list(final.items())[:10]:
+            print(f"  {k}: {v}")
+
+def _do_table(args, agent: SimFlowSetupAgent):
+    """Generate and save the parameter table for a vehicle category"""
+    print(f"Generating parameter table for {args.vehicle}")
+    table = agent.generator.generate_parameter_table(args.vehicle)
+    
+    output_file = agent.output_dir / f"{args.vehicle}_parameter_table.txt"
+    output_file.write_text(table)
+    
+    print(f"Parameter table generated and saved to: {output_file}")
+    print("\nTable preview:")
+    print(table[:2000] + "..." if len(table) > 2000 else table)
+
+# CLI command handlers, also the argparse choices for `command`
+_COMMANDS = {
+    "analyze": _do_analyze,
+    "compare": _do_compare,
+    "recommend": _do_recommend,
+    "table": _do_table,
+}
+
 def main():
     """Main function for command-line interface"""
     parser = argparse.ArgumentParser(description="SimFlow Setup Agent - Expert iRacing Setup Engineer")
-    parser.add_argument("command", choices=["analyze", "compare", "recommend", "table"], 
+    parser.add_argument("command", choices=list(_COMMANDS), 
                        help="Command to execute")
     parser.add_argument("--file", help="Setup file to analyze")
     parser.add_argument("--file1", help="First setup file for comparison")
@@ -724,85 +965,7 @@ def main():
     agent = SimFlowSetupAgent()
     
     try:
-        if args.command == "analyze":
-            if not args.file:
-                print("Error: --file is required for analyze command")
-                return
-            
-            print(f"Analyzing setup file: {args.file}")
-            analysis = agent.analyze_setup_file(args.file, args.vehicle, args.session)
-            
-            if "error" in analysis:
-                print(f"Error: {analysis['error']}")
-                return
-            
-            # Export results
-            exported_files = agent.export_analysis(analysis, args.output)
-            print(f"Analysis completed. Results exported to:")
-            for file in exported_files:
-                print(f"  {file}")
-        
-        elif args.command == "compare":
-            if not args.file1 or not args.file2:
-                print("Error: --file1 and --file2 are required for compare command")
-                return
-            
-            print(f"Comparing setups: {args.file1} vs {args.file2}")
-            comparison = agent.compare_setups(args.file1, args.file2, args.vehicle)
-            
-            if "error" in comparison:
-                print(f"Error: {comparison['error']}")
-                return
-            
-            # Generate and save comparison report
-            report = agent.generator.generate_setup_comparison_table(
-                comparison["setup1_data"], comparison["setup2_data"]
-            )
-            
-            output_file = agent.output_dir / "setup_comparison.txt"
-            with open(output_file, 'w') as f:
-                f.write(report)
-            
-            print(f"Comparison completed. Report saved to: {output_file}")
-        
-        elif args.command == "recommend":
-            if not args.track:
-                print("Error: --track is required for recommend command")
-                return
-            
-            print(f"Generating setup recommendations for {args.track}")
-            recommendations = agent.generate_setup_recommendations(
-                args.track, args.session, args.vehicle, args.aggression
-            )
-            
-            if "error" in recommendations:
-                print(f"Error: {recommendations['error']}")
-                return
-            
-            # Save recommendations
-            output_file = agent.output_dir / f"{args.track}_recommendations.json"
-            with open(output_file, 'w') as f:
-                json.dump(recommendations, f, indent=2)
-
-            print(f"Recommendations generated and saved to: {output_file}")
-            final = recommendations.get("final_recommendations", {})
-            if final:
-                print("\nKey Adjustments:")
-                for k, v in list(final.items())[:10]:
-                    print(f"  {k}: {v}")
-        
-        elif args.command == "table":
-            print(f"Generating parameter table for {args.vehicle}")
-            table = agent.generator.generate_parameter_table(args.vehicle)
-            
-            output_file = agent.output_dir / f"{args.vehicle}_parameter_table.txt"
-            with open(output_file, 'w') as f:
-                f.write(table)
-            
-            print(f"Parameter table generated and saved to: {output_file}")
-            print("\nTable preview:")
-            print(table[:2000] + "..." if len(table) > 2000 else table)
-    
+        _COMMANDS[args.command](args, agent)
     except Exception as e:
         logger.error(f"Error executing command: {e}")
         print(f"Error: {e}")
@@ -5,7 +5,7 @@ Creates human-readable setup sheets and parameter tables
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any
 import logging
 from datetime import datetime
 
@@ -15,30 +15,37 @@ class SetupSheetGenerator:
     def __init__(self, vehicle_profile_manager):
         self.logger = logging.getLogger(__name__)
         self.profile_manager = vehicle_profile_manager
+        self._table_renderers = {
+            "markdown": self.render_markdown_table,
+            "html": self.render_html_table,
+            "csv": self.render_csv_table
+        }
+    
+    def get_table_renderer(self, format_type: str = "markdown") -> Callable[[Dict], Iterator[str]]:
+        """Resolve the parameter table renderer for a format (markdown if unknown)"""
+        return self._table_renderers.get(format_type.lower(), self.render_markdown_table)
     
     def generate_parameter_table(self, vehicle_key: str, format_type: str = "markdown") -> str:
         """Generate a parameter table for a vehicle"""
+        return "".join(self.iter_parameter_table(vehicle_key, format_type))
+    
+    def iter_parameter_table(self, vehicle_key: str, format_type: str = "markdown") -> Iterator[str]:
+        """Yield a parameter table for a vehicle in row-sized chunks"""
         
         profile = self.profile_manager.get_profile(vehicle_key)
         if not profile:
-            return f"Vehicle profile '{vehicle_key}' not found"
+            yield f"Vehicle profile '{vehicle_key}' not found"
+            return
         
-        if format_type.lower() == "markdown":
-            return self._generate_markdown_table(profile)
-        elif format_type.lower() == "html":
-            return self._generate_html_table(profile)
-        elif format_type.lower() == "csv":
-            return self._generate_csv_table(profile)
-        else:
-            return self._generate_markdown_table(profile)
+        yield from self.get_table_renderer(format_type)(profile)
     
-    def _generate_markdown_table(self, profile: Dict) -> str:
+    def render_markdown_table(self, profile: Dict) -> Iterator[str]:
         """Generate a markdown formatted parameter table"""
         
         vehicle_info = profile.get("vehicle_info", {})
         setup_params = profile.get("setup_parameters", {})
         
-        output = f"""# {vehicle_info.get('name', 'Unknown Vehicle')} - Setup Parameters
+        yield f"""# {vehicle_info.get('name', 'Unknown Vehicle')} - Setup Parameters
 
 **Category**: {vehicle_info.get('category', 'Unknown')}  
 **Track Type**: {vehicle_info.get('track_type', 'Unknown')}  
@@ -48,11 +55,11 @@ class SetupSheetGenerator:
 """
         
         for category, params in setup_params.items():
-            output += f"## {category.replace('_', ' ').title()}\n\n"
+            yield f"## {category.replace('_', ' ').title()}\n\n"
             
             # Create table header
-            output += "| Parameter | Minimum | Maximum | Unit | Default | Description |\n"
-            output += "|-----------|---------|---------|------|---------|-------------|\n"
+            yield "| Parameter | Minimum | Maximum | Unit | Default | Description |\n"
+            yield "|-----------|---------|---------|------|---------|-------------|\n"
             
             for param_name, param_config in params.items():
                 # Format parameter name
@@ -84,70 +91,68 @@ class SetupSheetGenerator:
                 elif isinstance(max_val, float):
                     max_val = f"{max_val:.3f}".rstrip('0').rstrip('.')
                 
-                output += f"| {display_name} | {min_val} | {max_val} | {unit} | {default} | {description} |\n"
+                yield f"| {display_name} | {min_val} | {max_val} | {unit} | {default} | {description} |\n"
             
-            output += "\n"
+            yield "\n"
         
         # Add optimization priorities if available
         optimization = profile.get("optimization_priorities", {})
         if optimization:
-            output += "## Optimization Priorities\n\n"
+            yield "## Optimization Priorities\n\n"
             
             for track_type, priorities in optimization.items():
-                output += f"### {track_type.title()} Tracks\n\n"
+                yield f"### {track_type.title()} Tracks\n\n"
                 
                 if "primary" in priorities:
-                    output += "**Primary Focus**:\n"
+                    yield "**Primary Focus**:\n"
                     for param in priorities["primary"]:
-                        output += f"- {param.replace('_', ' ').title()}\n"
-                    output += "\n"
+                        yield f"- {param.replace('_', ' ').title()}\n"
+                    yield "\n"
                 
                 if "secondary" in priorities:
-                    output += "**Secondary**:\n"
+                    yield "**Secondary**:\n"
                     for param in priorities["secondary"]:
-                        output += f"- {param.replace('_', ' ').title()}\n"
-                    output += "\n"
+                        yield f"- {param.replace('_', ' ').title()}\n"
+                    yield "\n"
                 
                 if "fine_tuning" in priorities:
-                    output += "**Fine Tuning**:\n"
+                    yield "**Fine Tuning**:\n"
                     for param in priorities["fine_tuning"]:
-                        output += f"- {param.replace('_', ' ').title()}\n"
-                    output += "\n"
+                        yield f"- {param.replace('_', ' ').title()}\n"
+                    yield "\n"
         
         # Add telemetry channels
         telemetry = profile.get("telemetry_channels", {})
         if telemetry:
-            output += "## Required Telemetry Channels\n\n"
+            yield "## Required Telemetry Channels\n\n"
             
             if "critical" in telemetry:
-                output += "**Critical Channels**:\n"
+                yield "**Critical Channels**:\n"
                 for channel in telemetry["critical"]:
-                    output += f"- `{channel}`\n"
-                output += "\n"
+                    yield f"- `{channel}`\n"
+                yield "\n"
             
             if "important" in telemetry:
-                output += "**Important Channels**:\n"
+                yield "**Important Channels**:\n"
                 for channel in telemetry["important"]:
-                    output += f"- `{channel}`\n"
-                output += "\n"
+                    yield f"- `{channel}`\n"
+                yield "\n"
             
             if "supplementary" in telemetry:
-                output += "**Supplementary Channels**:\n"
+                yield "**Supplementary Channels**:\n"
                 for channel in telemetry["supplementary"]:
-                    output += f"- `{channel}`\n"
-                output += "\n"
+                    yield f"- `{channel}`\n"
+                yield "\n"
         
-        output += "---\n*Generated by SimFlowSetupBot - Expert iRacing Setup Engineering*\n"
-        
-        return output
+        yield "---\n*Generated by SimFlowSetupBot - Expert iRacing Setup Engineering*\n"
     
-    def _generate_html_table(self, profile: Dict) -> str:
+    def render_html_table(self, profile: Dict) -> Iterator[str]:
         """Generate an HTML formatted parameter table"""
         
         vehicle_info = profile.get("vehicle_info", {})
         setup_params = profile.get("setup_parameters", {})
         
-        html = f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html>
 <head>
     <title>{vehicle_info.get('name', 'Unknown Vehicle')} - Setup Parameters</title>
@@ -173,9 +178,9 @@ class SetupSheetGenerator:
 """
         
         for category, params in setup_params.items():
-            html += f"\n    <h2>{category.replace('_', ' ').title()}</h2>\n"
-            html += "    <table>\n"
-            html += "        <tr><th>Parameter</th><th>Minimum</th><th>Maximum</th><th>Unit</th><th>Description</th></tr>\n"
+            yield f"\n    <h2>{category.replace('_', ' ').title()}</h2>\n"
+            yield "    <table>\n"
+            yield "        <tr><th>Parameter</th><th>Minimum</th><th>Maximum</th><th>Unit</th><th>Description</th></tr>\n"
             
             for param_name, param_config in params.items():
                 display_name = param_name.replace('_', ' ').title()
@@ -190,22 +195,20 @@ class SetupSheetGenerator:
                     min_val = options[0] if options else "N/A"
                     max_val = options[-1] if options else "N/A"
                 
-                html += f"        <tr><td>{display_name}</td><td>{min_val}</td><td>{max_val}</td><td>{unit}</td><td>{description}</td></tr>\n"
+                yield f"        <tr><td>{display_name}</td><td>{min_val}</td><td>{max_val}</td><td>{unit}</td><td>{description}</td></tr>\n"
             
-            html += "    </table>\n"
+            yield "    </table>\n"
         
-        html += """
+        yield """
     <hr>
     <p><em>Generated by SimFlowSetupBot - Expert iRacing Setup Engineering</em></p>
 </body>
 </html>"""
-        
-        return html
     
-    def _generate_csv_table(self, profile: Dict) -> str:
+    def render_csv_table(self, profile: Dict) -> Iterator[str]:
         """Generate a CSV formatted parameter table"""
         
-        csv_lines = ["Category,Parameter,Minimum,Maximum,Unit,Description"]
+        yield "Category,Parameter,Minimum,Maximum,Unit,Description"
         
         setup_params = profile.get("setup_parameters", {})
         
@@ -223,21 +226,24 @@ class SetupSheetGenerator:
                     min_val = options[0] if options else "N/A"
                     max_val = options[-1] if options else "N/A"
                 
-                csv_lines.append(f"{category},{display_name},{min_val},{max_val},{unit},{description}")
-        
-        return "\n".join(csv_lines)
+                yield f"\n{category},{display_name},{min_val},{max_val},{unit},{description}"
     
     def generate_blank_setup_sheet(self, vehicle_key: str, format_type: str = "markdown") -> str:
         """Generate a blank setup sheet for data entry"""
+        return "".join(self.iter_blank_setup_sheet(vehicle_key, format_type))
+    
+    def iter_blank_setup_sheet(self, vehicle_key: str, format_type: str = "markdown") -> Iterator[str]:
+        """Yield a blank setup sheet for data entry in row-sized chunks"""
         
         profile = self.profile_manager.get_profile(vehicle_key)
         if not profile:
-            return f"Vehicle profile '{vehicle_key}' not found"
+            yield f"Vehicle profile '{vehicle_key}' not found"
+            return
         
         vehicle_info = profile.get("vehicle_info", {})
         setup_params = profile.get("setup_parameters", {})
         
-        output = f"""# {vehicle_info.get('name', 'Unknown Vehicle')} - Setup Sheet
+        yield f"""# {vehicle_info.get('name', 'Unknown Vehicle')} - Setup Sheet
 
 **Track**: ________________________  
 **Date**: ________________________  
@@ -247,7 +253,7 @@ class SetupSheetGenerator:
 """
         
         for category, params in setup_params.items():
-            output += f"## {category.replace('_', ' ').title()}\n\n"
+            yield f"## {category.replace('_', ' ').title()}\n\n"
             
             for param_name, param_config in params.items():
                 display_name = param_name.replace('_', ' ').title()
@@ -259,11 +265,11 @@ class SetupSheetGenerator:
                 if "options" in param_config:
                     options = param_config["options"]
                     options_str = " / ".join(str(opt) for opt in options)
-                    output += f"**{display_name}**: _______ ({options_str})\n\n"
+                    yield f"**{display_name}**: _______ ({options_str})\n\n"
                 else:
-                    output += f"**{display_name}**: _______ {unit} (Range: {min_val} - {max_val})\n\n"
+                    yield f"**{display_name}**: _______ {unit} (Range: {min_val} - {max_val})\n\n"
         
-        output += """## Notes
+        yield """## Notes
 
 **Handling Characteristics**:
 - Understeer/Oversteer: _________________________
@@ -284,5 +290,3 @@ _________________________________________________
 ---
 *Generated by SimFlowSetupBot - Expert iRacing Setup Engineering*
 """
-        
-        return output
@@ -61,6 +61,17 @@ class VehicleProfileManager:
         
         return categories
     
+    def list_names(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Get (profile key, vehicle name) pairs organized by category"""
+        names = {}
+        
+        for profile_key, profile_data in self.profiles.items():
+            vehicle_info = profile_data.get("vehicle_info", {})
+            category = vehicle_info.get("category", "other")
+            names.setdefault(category, []).append((profile_key, vehicle_info.get("name", "Unknown")))
+        
+        return names
+    
     def validate_setup_parameter(self, vehicle_key: str, parameter_category: str, 
                                 parameter_name: str, value: Any) -> Tuple[bool, str]:
         """Validate a setup parameter against vehicle constraints"""
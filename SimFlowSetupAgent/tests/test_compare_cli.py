@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+End-to-end test of the `compare` command of simflow_setup_agent.py
+Run from the repository root: python -m unittest discover -s SimFlowSetupAgent/tests
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+AGENT_DIR = Path(__file__).resolve().parent.parent
+
+SETUP_A = """<HTML><BODY><H2>nascarcup setup: oval<br> track: Daytona International Speedway</H2>
+Rear spoiler: <U>12.0 degrees</U><br>Front splitter: <U>1.5 in</U><br>Fuel level: <U>20.0 gal</U></BODY></HTML>
+"""
+
+SETUP_B = """<HTML><BODY><H2>nascarcup setup: oval<br> track: Daytona International Speedway</H2>
+Rear spoiler: <U>14.0 degrees</U><br>Front splitter: <U>1.5 in</U><br>Fuel level: <U>18.0 gal</U></BODY></HTML>
+"""
+
+
+class CompareCommandTest(unittest.TestCase):
+    """Run `compare` on a scratch copy of the agent so its output and folders stay out of the tree"""
+
+    def setUp(self):
+        self.work = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.work)
+        self.agent_dir = self.work / "agent"
+        self.agent_dir.mkdir()
+        shutil.copy2(AGENT_DIR / "simflow_setup_agent.py", self.agent_dir)
+        shutil.copytree(AGENT_DIR / "scripts", self.agent_dir / "scripts",
+                        ignore=shutil.ignore_patterns("__pycache__"))
+        shutil.copytree(AGENT_DIR / "vehicle_profiles", self.agent_dir / "vehicle_profiles",
+                        ignore=shutil.ignore_patterns(".*"))
+        (self.work / "a.htm").write_text(SETUP_A)
+        (self.work / "b.htm").write_text(SETUP_B)
+
+    def run_agent(self, *args):
+        return subprocess.run(
+            [sys.executable, "simflow_setup_agent.py", *args],
+            cwd=self.agent_dir, capture_output=True, text=True, timeout=120,
+        )
+
+    def test_compare_writes_report(self):
+        result = self.run_agent("compare", "--file1", str(self.work / "a.htm"), "--file2", str(self.work / "b.htm"))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Comparison completed", result.stdout)
+        self.assertNotIn("Error", result.stdout)
+
+        report = (self.agent_dir / "output" / "setup_comparison.txt").read_text()
+        self.assertIn("SETUP COMPARISON", report)
+        self.assertIn("Setup 1: a.htm", report)
+        self.assertIn("Setup 2: b.htm", report)
+        self.assertRegex(report, r"Rear Spoiler\s+12\.0\s+14\.0\s+\+2\.000")
+
+    def test_compare_failure_leaves_no_report(self):
+        result = self.run_agent("compare", "--file1", str(self.work / "missing.htm"), "--file2", str(self.work / "b.htm"))
+        self.assertIn("Error: Failed to parse one or both setup files", result.stdout)
+        self.assertFalse((self.agent_dir / "output" / "setup_comparison.txt").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()